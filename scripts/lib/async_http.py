@@ -0,0 +1,279 @@
+"""Asyncio HTTP client for saas-radar skill (stdlib only).
+
+A minimal HTTP/1.1 client over asyncio streams, used by the --async
+pipeline so hundreds of Reddit fetches can be in flight on one event
+loop. Mirrors http.request: same per-host RetryPolicy, same HTTPError type.
+"""
+
+import asyncio
+import json
+import ssl
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from . import http, ratelimit, timing
+
+HOST_CONCURRENCY = 64  # Max in-flight requests per host
+
+_ssl_context = ssl.create_default_context()
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+
+def _host_semaphore(host: str) -> asyncio.Semaphore:
+    """Get the per-host semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    per_loop = _semaphores.setdefault(loop, {})
+    if host not in per_loop:
+        per_loop[host] = asyncio.Semaphore(HOST_CONCURRENCY)
+    return per_loop[host]
+
+
+async def _read_body(
+    reader: asyncio.StreamReader,
+    headers: Dict[str, str],
+    decoder: http.StreamDecoder,
+) -> bytes:
+    """Read a response body using chunked, Content-Length or EOF framing.
+
+    Each piece is passed through decoder as it arrives.
+    """
+    chunks = []
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                # Skip trailers
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                break
+            chunks.append(decoder.feed(await reader.readexactly(size)))
+            await reader.readexactly(2)
+    else:
+        length = headers.get("content-length")
+        remaining = int(length) if length is not None else None
+        while remaining is None or remaining > 0:
+            size = http.READ_CHUNK_SIZE if remaining is None else min(remaining, http.READ_CHUNK_SIZE)
+            chunk = await reader.read(size)
+            if not chunk:
+                if remaining:
+                    raise asyncio.IncompleteReadError(b"", remaining)
+                break
+            chunks.append(decoder.feed(chunk))
+            if remaining is not None:
+                remaining -= len(chunk)
+    chunks.append(decoder.flush())
+    return b"".join(chunks)
+
+
+async def _send(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[bytes],
+) -> Tuple[int, str, bytes, Dict[str, str], int]:
+    """Send one request on a fresh connection, following redirects.
+
+    Hosts that HTTP(S)_PROXY applies to are sent via http._send on a
+    worker thread instead.
+
+    Returns:
+        Tuple of (status, reason, decoded body bytes, lowercased response
+        headers, bytes received on the wire)
+    """
+    wire_bytes = 0
+    for _ in range(http.MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        scheme = parts.scheme or "https"
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        if http.proxy_for(scheme, host):
+            # Proxied hosts go through http's pool, which speaks CONNECT
+            status, reason, body, response_headers, nbytes = await asyncio.to_thread(
+                http._send, method, url, headers, data, http.DEFAULT_TIMEOUT,
+            )
+            response_headers = {name.lower(): value for name, value in response_headers.items()}
+            return status, reason, body, response_headers, wire_bytes + nbytes
+
+        async with _host_semaphore(host):
+            reader, writer = await asyncio.open_connection(
+                host, port, ssl=_ssl_context if scheme == "https" else None,
+            )
+            try:
+                lines = [f"{method} {path} HTTP/1.1", f"Host: {parts.netloc}", "Connection: close"]
+                for name, value in headers.items():
+                    lines.append(f"{name}: {value}")
+                if data is not None:
+                    lines.append(f"Content-Length: {len(data)}")
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+                if data is not None:
+                    writer.write(data)
+                await writer.drain()
+
+                status_line = (await reader.readline()).decode("latin-1").strip()
+                if not status_line:
+                    raise ConnectionResetError("Empty response")
+                _, status_str, *reason = status_line.split(" ", 2)
+                status = int(status_str)
+                reason = reason[0] if reason else ""
+
+                response_headers: Dict[str, str] = {}
+                while True:
+                    line = (await reader.readline()).decode("latin-1")
+                    if line in ("\r\n", "\n", ""):
+                        break
+                    name, _, value = line.partition(":")
+                    response_headers[name.strip().lower()] = value.strip()
+
+                decoder = http.StreamDecoder(response_headers.get("content-encoding"))
+                body = await _read_body(reader, response_headers, decoder)
+                wire_bytes += decoder.wire_bytes
+                decoder.log_sizes()
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass  # Peer already gone; the transport is closed either way
+
+        location = response_headers.get("location")
+        if status in http.REDIRECT_CODES and location:
+            url = urljoin(url, location)
+            if status == 303 or (status in (301, 302) and method == "POST"):
+                method, data = "GET", None
+            continue
+
+        return status, reason, body, response_headers, wire_bytes
+
+    raise http.HTTPError(f"Too many redirects: {url}")
+
+
+async def request(
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    json_data: Optional[Dict[str, Any]] = None,
+    timeout: int = http.DEFAULT_TIMEOUT,
+    retries: Optional[int] = None,
+    conditional: bool = False,
+) -> Dict[str, Any]:
+    """Make an async HTTP request and return JSON response.
+
+    Args:
+        method: HTTP method (GET, POST, etc.)
+        url: Request URL
+        headers: Optional headers dict
+        json_data: Optional JSON body (for POST)
+        timeout: Request timeout in seconds
+        retries: Max attempts (default: the host's RetryPolicy)
+        conditional: For GETs, revalidate against the validator cache
+            (see http.request)
+
+    Returns:
+        Parsed JSON response
+
+    Raises:
+        http.HTTPError: On request failure
+    """
+    headers = dict(headers or {})
+    headers.setdefault("User-Agent", http.USER_AGENT)
+    headers.setdefault("Accept-Encoding", http.ACCEPT_ENCODING)
+
+    data = None
+    if json_data is not None:
+        data = json.dumps(json_data).encode('utf-8')
+        headers.setdefault("Content-Type", "application/json")
+
+    http.log(f"{method} {url} (async)")
+
+    host = urlsplit(url).hostname or ""
+    policy = http.get_retry_policy(host)
+    breaker = http.get_circuit_breaker(host)
+    conditional = conditional and method == "GET"
+    cached = await asyncio.to_thread(http.add_validators, url, headers) if conditional else None
+    max_attempts = retries if retries is not None else policy.max_attempts
+    slept = 0.0
+    started = time.monotonic()
+    status = None
+    nbytes = 0
+    decoded_bytes = 0
+    attempt = 0
+    last_error = None
+    try:
+        for attempt in range(max_attempts):
+            status = None
+            response_headers = None
+            breaker.before_request()
+            try:
+                await asyncio.sleep(ratelimit.reserve_host(host))
+                try:
+                    status, reason, raw, response_headers, wire_bytes = await asyncio.wait_for(
+                        _send(method, url, headers, data), timeout,
+                    )
+                finally:
+                    breaker.record(not http.is_failure_status(status))
+                ratelimit.observe_response(host, response_headers)
+                nbytes += wire_bytes
+                decoded_bytes += len(raw)
+                if status >= 400:
+                    body = raw.decode('utf-8', errors='replace')
+                    http.log(f"HTTP Error {status}: {reason}")
+                    last_error = http.HTTPError(f"HTTP {status}: {reason}", status, body)
+
+                    # Don't retry client errors (4xx) except rate limits
+                    if not policy.should_retry(status):
+                        raise last_error
+                elif status == 304 and cached is not None:
+                    http.log("Not modified: using cached body")
+                    await asyncio.to_thread(http.store_validators, url, response_headers, cached["data"], cached)
+                    return cached["data"]
+                else:
+                    body = raw.decode('utf-8')
+                    http.log(f"Response: {status} ({len(body)} bytes)")
+                    try:
+                        result = json.loads(body) if body else {}
+                    except json.JSONDecodeError as e:
+                        raise http.HTTPError(f"Invalid JSON response: {e}")
+                    if conditional:
+                        await asyncio.to_thread(http.store_validators, url, response_headers, result)
+                    return result
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+                http.log(f"Connection error: {type(e).__name__}: {e}")
+                last_error = http.HTTPError(f"Connection error: {type(e).__name__}: {e}")
+
+            if attempt < max_attempts - 1:
+                if breaker.is_open:
+                    break
+                delay = policy.delay(attempt, status, response_headers)
+                if slept + delay > policy.budget:
+                    http.log(f"Retry budget exhausted ({slept:.1f}s slept, next wait {delay:.1f}s)")
+                    break
+                await asyncio.sleep(delay)
+                slept += delay
+    finally:
+        timing.record_request(
+            method, url, status, time.monotonic() - started, nbytes, attempt, decoded_bytes,
+        )
+
+    if last_error:
+        raise last_error
+    raise http.HTTPError("Request failed with no error details")
+
+
+async def get(url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Dict[str, Any]:
+    """Make an async GET request."""
+    return await request("GET", url, headers=headers, **kwargs)
+
+
+async def get_reddit_json(path: str) -> Dict[str, Any]:
+    """Fetch Reddit thread JSON asynchronously (see http.get_reddit_json)."""
+    return await get(http.reddit_json_url(path), headers={
+        "User-Agent": http.USER_AGENT,
+        "Accept": "application/json",
+    })
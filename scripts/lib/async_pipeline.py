@@ -0,0 +1,259 @@
+"""Asyncio variants of the Reddit-heavy pipeline phases.
+
+Used by saas_radar --async. Growth scanning and thread enrichment run
+as tasks on one event loop over async_http, reusing the same parsing
+helpers, enrichment plan, per-host rate limiter and thread cache as the
+threaded implementation. SQLite and cache-file I/O run via
+asyncio.to_thread so they never block the loop.
+"""
+
+import asyncio
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from . import (
+    async_http,
+    cache,
+    growth_batch,
+    growth_store,
+    http,
+    reddit_enrich,
+    schema,
+    subreddit_growth,
+    timing,
+)
+
+
+def _log(msg: str):
+    """Log to stderr."""
+    sys.stderr.write(f"[ASYNC] {msg}\n")
+    sys.stderr.flush()
+
+
+async def _fetch_json(url: str, conditional: bool = True) -> Optional[Dict[str, Any]]:
+    """GET a Reddit JSON URL, returning None on failure."""
+    try:
+        return await async_http.get(url, headers=subreddit_growth.REDDIT_HEADERS, conditional=conditional)
+    except http.HTTPError as e:
+        _log(f"Failed to fetch {url}: {e}")
+        return None
+
+
+async def _crawl_posts_async(
+    sub: str,
+    store: growth_store.GrowthStore,
+    cutoff: float,
+    stop_at: Optional[float],
+) -> Optional[float]:
+    """Async subreddit_growth.crawl_subreddit_posts, streaming pages into store."""
+    after = None
+    oldest = None
+    for page in range(subreddit_growth.MAX_PAGES):
+        data = await _fetch_json(subreddit_growth.posts_url(sub, after=after), conditional=after is None)
+        if data is None:
+            return oldest if page else None
+        posts = subreddit_growth.parse_subreddit_posts(data)
+        kept, done = subreddit_growth.take_page(posts, cutoff, stop_at)
+        if kept:
+            await asyncio.to_thread(store.record_posts, sub, kept)
+        if posts:
+            oldest = min(p["created_utc"] for p in posts)
+        reach = subreddit_growth.crawl_reach(cutoff, stop_at, done, subreddit_growth.listing_after(data), oldest)
+        if reach is not None:
+            return reach
+        after = subreddit_growth.listing_after(data)
+    return oldest
+
+
+async def scan_growth_async(
+    mock: bool = False,
+    subreddits: Optional[List[str]] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    max_age_hours: float = cache.GROWTH_CACHE_TTL_HOURS,
+    refresh: bool = False,
+) -> List[schema.GrowthSignal]:
+    """Scan subreddits for growth signals on the event loop.
+
+    Same results as subreddit_growth.scan_growth; every request is paced
+    by the shared reddit.com limiter in async_http.
+
+    Args:
+        mock: If True, load from fixtures
+        subreddits: Override subreddit list
+        progress_callback: Optional callback(current, total)
+        max_age_hours: Reuse cached signals younger than this
+        refresh: If True, rescan every subreddit
+
+    Returns:
+        List of GrowthSignal sorted by acceleration descending
+    """
+    if mock:
+        return subreddit_growth.scan_growth(mock=True)
+
+    fresh, subs = await asyncio.to_thread(
+        subreddit_growth.split_fresh,
+        subreddits or subreddit_growth.SAAS_SUBREDDITS, max_age_hours, refresh,
+    )
+    total = len(fresh) + len(subs)
+    completed = len(fresh)
+    if fresh and progress_callback:
+        progress_callback(completed, total)
+    if not subs:
+        fresh.sort(key=lambda s: s.acceleration, reverse=True)
+        return fresh
+
+    store = growth_store.get_store()
+    await asyncio.to_thread(store.prune)
+
+    async def _scan_one(sub: str) -> Optional[Dict[str, Any]]:
+        nonlocal completed
+        stop_at = await asyncio.to_thread(subreddit_growth.crawl_stop_at, store, sub)
+        cutoff = time.time() - subreddit_growth.GROWTH_DAYS * 86400
+        about_data, reached = await asyncio.gather(
+            _fetch_json(f"https://www.reddit.com/r/{sub}/about.json"),
+            _crawl_posts_async(sub, store, cutoff, stop_at),
+        )
+        if reached is not None:
+            await asyncio.to_thread(subreddit_growth.record_crawl, store, sub, reached, stop_at)
+        completed += 1
+        if progress_callback:
+            progress_callback(completed, total)
+        if about_data is None or reached is None:
+            return None
+        return subreddit_growth.parse_subreddit_about(about_data)
+
+    results = await asyncio.gather(*(_scan_one(sub) for sub in subs))
+    abouts = {sub: about for sub, about in zip(subs, results) if about}
+    signals = await asyncio.to_thread(
+        timing.bind(growth_batch.growth_from_store), store, abouts, subreddit_growth.GROWTH_DAYS,
+    )
+    await asyncio.to_thread(cache.save_growth_signals, [s.to_dict() for s in signals])
+    signals.extend(fresh)
+    signals.sort(key=lambda s: s.acceleration, reverse=True)
+    return signals
+
+
+async def _fetch_thread_async(url: str, use_cache: bool) -> Optional[Any]:
+    """Async reddit_enrich.fetch_thread_data (without mock data)."""
+    path = reddit_enrich.extract_reddit_path(url)
+    if not path:
+        return None
+
+    key = reddit_enrich.thread_cache_key(url)
+    cached, age_hours = (None, None)
+    if key and use_cache:
+        cached, age_hours = await asyncio.to_thread(cache.load_thread_cache, key)
+        if cached is not None and age_hours < cache.THREAD_ENGAGEMENT_TTL_HOURS:
+            return cached
+        if cached is not None and age_hours < cache.THREAD_STALE_TTL_HOURS:
+            reddit_enrich.revalidate_thread(path, key)
+            return cached
+
+    try:
+        data = await async_http.get_reddit_json(path)
+    except http.HTTPError:
+        return cached
+    if key and data:
+        await asyncio.to_thread(cache.save_thread_cache, key, data)
+    return data
+
+
+async def _fetch_submissions_info_async(fullnames: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Async reddit_enrich.fetch_submissions_info: all /api/info batches at once."""
+    async def _batch(url: str) -> Dict[str, Dict[str, Any]]:
+        try:
+            return reddit_enrich.parse_info(await async_http.get(url, headers=reddit_enrich.INFO_HEADERS))
+        except http.HTTPError:
+            return {}
+
+    result = {}
+    for batch in await asyncio.gather(*(_batch(url) for url in reddit_enrich.info_urls(fullnames))):
+        result.update(batch)
+    return result
+
+
+async def enrich_reddit_items_async(
+    items: List[Dict[str, Any]],
+    mock_thread_data: Optional[Dict] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    error_callback: Optional[Callable[[Dict[str, Any], Exception], None]] = None,
+    use_cache: bool = True,
+    comments: bool = True,
+) -> List[Dict[str, Any]]:
+    """Enrich Reddit items with one task per thread download.
+
+    Same plan as reddit_enrich.enrich_reddit_items (cache, bulk /api/info
+    engagement, full downloads only where needed). Concurrency is
+    bounded by async_http.HOST_CONCURRENCY and pacing by the shared
+    reddit.com limiter, not by a thread pool. Results keep input order
+    and failures are isolated per item.
+
+    Args:
+        items: Reddit item dicts
+        mock_thread_data: Mock data for testing
+        progress_callback: Optional callback(completed, total)
+        error_callback: Optional callback(item, exception) on failure
+        use_cache: If False, bypass the on-disk thread cache
+        comments: If False, only refresh engagement (no thread downloads)
+
+    Returns:
+        Enriched items in input order
+    """
+    total = len(items)
+    if not total:
+        return []
+
+    plan = await asyncio.to_thread(
+        reddit_enrich.plan_enrichment, items, mock_thread_data, use_cache, comments,
+    )
+    submissions = {}
+    if plan.engagement_keys:
+        submissions = await _fetch_submissions_info_async(list(plan.engagement_keys.values()))
+    downloads = set(plan.downloads)
+    completed = 0
+
+    async def _one(index: int, item: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal completed
+        try:
+            if index in downloads:
+                if mock_thread_data is not None:
+                    thread_data = mock_thread_data
+                else:
+                    thread_data = await _fetch_thread_async(item.get("url", ""), use_cache)
+                if thread_data:
+                    item = reddit_enrich.enrich_reddit_item(item, thread_data)
+            else:
+                item = reddit_enrich.apply_plan(item, index, plan, submissions)
+        except Exception as e:
+            if error_callback:
+                error_callback(item, e)
+        completed += 1
+        if progress_callback:
+            progress_callback(completed, total)
+        return item
+
+    return list(await asyncio.gather(*(_one(index, item) for index, item in enumerate(items))))
+
+
+async def fetch_comments_async(
+    items: List[schema.SaaSIdeaItem],
+    limit: int = reddit_enrich.COMMENT_TOP_K,
+    error_callback: Optional[Callable[[Any, Exception], None]] = None,
+    use_cache: bool = True,
+) -> int:
+    """Async reddit_enrich.fetch_comments: comment trees for the top items only."""
+    async def _one(item: schema.SaaSIdeaItem) -> bool:
+        try:
+            thread_data = await _fetch_thread_async(item.url, use_cache)
+            if not thread_data:
+                return False
+            reddit_enrich.apply_comments(item, thread_data)
+            return True
+        except Exception as e:
+            if error_callback:
+                error_callback(item, e)
+            return False
+
+    targets = reddit_enrich.comment_targets(items, limit)
+    return sum(await asyncio.gather(*(_one(item) for item in targets)))
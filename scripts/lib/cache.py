@@ -3,6 +3,9 @@
 import hashlib
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -10,6 +13,58 @@ from typing import Any, Optional
 CACHE_DIR = Path.home() / ".cache" / "saas-radar"
 DEFAULT_TTL_HOURS = 24
 MODEL_CACHE_TTL_DAYS = 7
+MEMORY_CACHE_ENTRIES = 2048  # Per in-memory layer (reports, threads)
+
+
+class _MemoryCache:
+    """Bounded LRU of (data, saved_at) kept in front of the on-disk cache.
+
+    Only active after enable_memory_cache(), i.e. in long-running
+    processes where repeated reads would otherwise hit the disk and
+    re-parse JSON every time.
+    """
+
+    def __init__(self, max_entries: int = MEMORY_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: str, ttl_hours: float) -> tuple:
+        """Return (data, age_hours), or (None, None) if missing or expired."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None, None
+            data, saved_at = entry
+            age = (time.time() - saved_at) / 3600
+            if age >= ttl_hours:
+                return None, None
+            self.entries.move_to_end(key)
+            return data, age
+
+    def put(self, key: str, data: Any, saved_at: Optional[float] = None):
+        """Store data, evicting the least recently used entry if full."""
+        with self.lock:
+            self.entries[key] = (data, saved_at if saved_at is not None else time.time())
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+MEMORY_CACHE = False
+_report_memory = _MemoryCache()
+_thread_memory = _MemoryCache()
+_http_memory = _MemoryCache()
+
+
+def enable_memory_cache():
+    """Keep report and thread cache entries in memory (daemon mode)."""
+    global MEMORY_CACHE
+    MEMORY_CACHE = True
 
 
 def ensure_cache_dir():
@@ -17,9 +72,22 @@ def ensure_cache_dir():
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def get_cache_key(topic: str, from_date: str, to_date: str, sources: str) -> str:
-    """Generate a cache key from query parameters."""
-    key_data = f"{topic}|{from_date}|{to_date}|{sources}"
+def get_cache_key(
+    topic: str,
+    from_date: str,
+    to_date: str,
+    sources: str,
+    depth: str = "default",
+    discover: bool = False,
+) -> str:
+    """Generate a cache key from query parameters.
+
+    discover (subreddit discovery changes the growth signals in the
+    report) only enters the key when set, so other keys are unchanged.
+    """
+    key_data = f"{topic}|{from_date}|{to_date}|{sources}|{depth}"
+    if discover:
+        key_data += "|discover"
     return hashlib.sha256(key_data.encode()).hexdigest()[:16]
 
 
@@ -76,6 +144,11 @@ def load_cache_with_age(cache_key: str, ttl_hours: int = DEFAULT_TTL_HOURS) -> t
     Returns:
         Tuple of (data, age_hours) or (None, None) if invalid
     """
+    if MEMORY_CACHE:
+        data, age = _report_memory.get(cache_key, ttl_hours)
+        if data is not None:
+            return data, age
+
     cache_path = get_cache_path(cache_key)
 
     if not is_cache_valid(cache_path, ttl_hours):
@@ -85,13 +158,18 @@ def load_cache_with_age(cache_key: str, ttl_hours: int = DEFAULT_TTL_HOURS) -> t
 
     try:
         with open(cache_path, 'r') as f:
-            return json.load(f), age
+            data = json.load(f)
     except (json.JSONDecodeError, OSError):
         return None, None
+    if MEMORY_CACHE:
+        _report_memory.put(cache_key, data, time.time() - age * 3600)
+    return data, age
 
 
 def save_cache(cache_key: str, data: dict):
     """Save data to cache."""
+    if MEMORY_CACHE:
+        _report_memory.put(cache_key, data)
     ensure_cache_dir()
     cache_path = get_cache_path(cache_key)
 
@@ -104,6 +182,8 @@ def save_cache(cache_key: str, data: dict):
 
 def clear_cache():
     """Clear all cache files."""
+    _report_memory.clear()
+    _http_memory.clear()
     if CACHE_DIR.exists():
         for f in CACHE_DIR.glob("*.json"):
             try:
@@ -150,3 +230,220 @@ def set_cached_model(provider: str, model: str):
     cache[provider] = model
     cache['updated_at'] = datetime.now(timezone.utc).isoformat()
     save_model_cache(cache)
+
+
+# Growth signal cache: the last GrowthSignal per subreddit with the
+# time it was computed, so scans only redo subreddits that went stale.
+GROWTH_CACHE_FILE = CACHE_DIR / "growth_signals.json"
+GROWTH_CACHE_TTL_HOURS = 12
+_growth_lock = threading.Lock()
+
+
+def load_growth_cache() -> dict:
+    """Load cached growth signals.
+
+    Returns:
+        Dict of lowercased subreddit -> {"signal": dict, "scanned_at": epoch}
+    """
+    try:
+        with open(GROWTH_CACHE_FILE, 'r') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_growth_signals(signals: list):
+    """Merge freshly computed signal dicts into the growth cache."""
+    now = time.time()
+    with _growth_lock:
+        entries = load_growth_cache()
+        for signal in signals:
+            entries[signal["subreddit"].lower()] = {"signal": signal, "scanned_at": now}
+        try:
+            ensure_cache_dir()
+            tmp_path = GROWTH_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, GROWTH_CACHE_FILE)
+        except OSError:
+            pass  # Silently fail on cache write errors
+
+
+# Discovered subreddits: the ranked candidate list added to the growth
+# scan. While it is fresh, discovery does no network work at all.
+DISCOVERY_CACHE_FILE = CACHE_DIR / "discovered_subreddits.json"
+DISCOVERY_CACHE_TTL_HOURS = 24
+
+
+def load_discovery_cache(max_age_hours: float = DISCOVERY_CACHE_TTL_HOURS) -> Optional[list]:
+    """Load the cached candidate list if younger than max_age_hours."""
+    try:
+        with open(DISCOVERY_CACHE_FILE, 'r') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("subreddits"), list):
+        return None
+    if (time.time() - data.get("saved_at", 0)) / 3600 >= max_age_hours:
+        return None
+    return data["subreddits"]
+
+
+def save_discovery_cache(subreddits: list):
+    """Save the ranked candidate list."""
+    try:
+        ensure_cache_dir()
+        tmp_path = DISCOVERY_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({"subreddits": subreddits, "saved_at": time.time()}, f)
+        os.replace(tmp_path, DISCOVERY_CACHE_FILE)
+    except OSError:
+        pass  # Silently fail on cache write errors
+
+
+# Reddit thread cache: one file per thread, keyed by post ID.
+# Engagement (score, comments) goes stale quickly: entries older than
+# THREAD_ENGAGEMENT_TTL_HOURS are served stale while a background
+# refresh runs, up to THREAD_STALE_TTL_HOURS. Title, created_utc and
+# selftext never change, so entries are kept much longer and served as
+# a fallback when a blocking refetch fails.
+THREAD_CACHE_DIR = CACHE_DIR / "threads"
+THREAD_ENGAGEMENT_TTL_HOURS = 1
+THREAD_STALE_TTL_HOURS = 24  # Serve stale and revalidate in the background
+THREAD_IMMUTABLE_TTL_DAYS = 30
+
+
+def get_thread_cache_path(thread_key: str) -> Path:
+    """Get path to a thread cache file."""
+    return THREAD_CACHE_DIR / f"{thread_key}.json"
+
+
+def load_thread_cache(thread_key: str) -> tuple:
+    """Load cached thread JSON with age info.
+
+    Returns:
+        Tuple of (data, age_hours) or (None, None) if missing or older
+        than the immutable-field TTL
+    """
+    if MEMORY_CACHE:
+        data, age = _thread_memory.get(thread_key, THREAD_IMMUTABLE_TTL_DAYS * 24)
+        if data is not None:
+            return data, age
+
+    cache_path = get_thread_cache_path(thread_key)
+
+    if not is_cache_valid(cache_path, THREAD_IMMUTABLE_TTL_DAYS * 24):
+        return None, None
+
+    age = get_cache_age_hours(cache_path)
+
+    try:
+        with open(cache_path, 'r') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None, None
+    if MEMORY_CACHE:
+        _thread_memory.put(thread_key, data, time.time() - age * 3600)
+    return data, age
+
+
+def save_thread_cache(thread_key: str, data: Any):
+    """Save thread JSON to cache atomically (safe across worker threads)."""
+    if MEMORY_CACHE:
+        _thread_memory.put(thread_key, data)
+    try:
+        THREAD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = get_thread_cache_path(thread_key)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Silently fail on cache write errors
+
+
+# Conditional-GET cache: response bodies stored with their ETag and
+# Last-Modified validators so http.request can revalidate with
+# If-None-Match/If-Modified-Since and reuse the body on a 304.
+# Only stable URLs (about.json, widgets, first listing pages) use it.
+HTTP_CACHE_DIR = CACHE_DIR / "http"
+HTTP_CACHE_TTL_DAYS = 7
+_http_pruned = False
+_http_prune_lock = threading.Lock()
+
+
+def get_http_cache_path(url: str) -> Path:
+    """Get path to the validator cache file for a URL."""
+    return HTTP_CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()[:24]}.json"
+
+
+def load_http_cache(url: str) -> Optional[dict]:
+    """Load a cached response with its validators.
+
+    Returns:
+        Dict with url, etag, last_modified and data, or None
+    """
+    if MEMORY_CACHE:
+        entry, _ = _http_memory.get(url, HTTP_CACHE_TTL_DAYS * 24)
+        if entry is not None:
+            return entry
+
+    cache_path = get_http_cache_path(url)
+    if not is_cache_valid(cache_path, HTTP_CACHE_TTL_DAYS * 24):
+        return None
+
+    try:
+        with open(cache_path, 'r') as f:
+            entry = json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return None
+    if entry.get("url") != url:
+        return None
+    if MEMORY_CACHE:
+        _http_memory.put(url, entry)
+    return entry
+
+
+def prune_http_cache() -> int:
+    """Delete validator cache files (and stray temp files) older than the TTL.
+
+    Returns:
+        Number of files removed
+    """
+    if not HTTP_CACHE_DIR.exists():
+        return 0
+    cutoff = time.time() - HTTP_CACHE_TTL_DAYS * 86400
+    removed = 0
+    for f in HTTP_CACHE_DIR.iterdir():
+        try:
+            if f.stat().st_mtime < cutoff:
+                f.unlink()
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def save_http_cache(url: str, etag: Optional[str], last_modified: Optional[str], data: Any):
+    """Save a response body with its validators (atomic, thread-safe).
+
+    The first save in a process prunes expired entries.
+    """
+    global _http_pruned
+    entry = {"url": url, "etag": etag, "last_modified": last_modified, "data": data}
+    if MEMORY_CACHE:
+        _http_memory.put(url, entry)
+    with _http_prune_lock:
+        prune, _http_pruned = not _http_pruned, True
+    if prune:
+        prune_http_cache()
+    try:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = get_http_cache_path(url)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Silently fail on cache write errors
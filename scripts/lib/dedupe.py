@@ -1,72 +1,106 @@
 """Near-duplicate detection for saas-radar skill."""
 
-import re
-from typing import List, Set, Tuple
+import math
+from collections import Counter
+from typing import Dict, FrozenSet, List, Tuple
 
-from . import schema
+from . import features, schema
+from .features import get_ngrams, jaccard_similarity, normalize_text  # noqa: F401 (re-exported)
 
 
-def normalize_text(text: str) -> str:
-    """Normalize text for comparison."""
-    text = text.lower()
-    text = re.sub(r'[^\w\s]', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+def _find_duplicates_brute(
+    ngrams: List[FrozenSet[int]],
+    threshold: float,
+) -> List[Tuple[int, int]]:
+    """Compare every pair of n-gram sets."""
+    duplicates = []
+    for i in range(len(ngrams)):
+        for j in range(i + 1, len(ngrams)):
+            similarity = jaccard_similarity(ngrams[i], ngrams[j])
+            if similarity >= threshold:
+                duplicates.append((i, j))
+    return duplicates
+
+
+def _find_duplicates_indexed(
+    ngrams: List[FrozenSet[int]],
+    threshold: float,
+) -> List[Tuple[int, int]]:
+    """Find duplicate pairs via prefix filtering on an inverted index.
+
+    Shingles in each set are ordered rarest-first. Any pair with
+    Jaccard >= t overlaps in at least ceil(t * |x|) shingles, so the
+    first |x| - ceil(t * |x|) + 1 shingles of both sets must share one.
+    Only sets sharing a rare prefix shingle (and of compatible size)
+    are verified, which finds exactly the pairs brute force finds.
+    """
+    doc_freq = Counter(sh for grams in ngrams for sh in grams)
+    order = sorted(range(len(ngrams)), key=lambda idx: len(ngrams[idx]))
 
+    index: Dict[int, List[int]] = {}
+    duplicates = []
+
+    for i in order:
+        grams = ngrams[i]
+        size = len(grams)
+        # Epsilon guards against float error shortening the prefix
+        prefix_len = size - math.ceil(threshold * size - 1e-9) + 1
+        prefix = sorted(grams, key=lambda sh: (doc_freq[sh], sh))[:prefix_len]
+        min_size = threshold * size - 1e-9
+
+        candidates = set()
+        for sh in prefix:
+            for j in index.get(sh, ()):
+                if len(ngrams[j]) >= min_size:
+                    candidates.add(j)
 
-def get_ngrams(text: str, n: int = 3) -> Set[str]:
-    """Get character n-grams from text."""
-    text = normalize_text(text)
-    if len(text) < n:
-        return {text}
-    return {text[i:i+n] for i in range(len(text) - n + 1)}
+        for j in candidates:
+            if jaccard_similarity(grams, ngrams[j]) >= threshold:
+                duplicates.append((min(i, j), max(i, j)))
 
+        for sh in prefix:
+            index.setdefault(sh, []).append(i)
 
-def jaccard_similarity(set1: Set[str], set2: Set[str]) -> float:
-    """Compute Jaccard similarity between two sets."""
-    if not set1 or not set2:
-        return 0.0
-    intersection = len(set1 & set2)
-    union = len(set1 | set2)
-    return intersection / union if union > 0 else 0.0
+    duplicates.sort()
+    return duplicates
 
 
 def find_duplicates(
     items: List[schema.SaaSIdeaItem],
     threshold: float = 0.7,
+    method: str = "indexed",
 ) -> List[Tuple[int, int]]:
     """Find near-duplicate pairs in items.
 
     Args:
         items: List of items to check
         threshold: Similarity threshold (0-1)
+        method: 'indexed' (prefix-filtered inverted index) or 'brute'
+            (all pairs, for verification); both return the same pairs
 
     Returns:
-        List of (i, j) index pairs where i < j
+        List of (i, j) index pairs where i < j, sorted
     """
-    duplicates = []
-
-    # Pre-compute n-grams on title
-    ngrams = [get_ngrams(item.title) for item in items]
+    # Hashed n-grams on title (memoized on each item)
+    ngrams = [features.shingles(item, "title") for item in items]
 
-    for i in range(len(items)):
-        for j in range(i + 1, len(items)):
-            similarity = jaccard_similarity(ngrams[i], ngrams[j])
-            if similarity >= threshold:
-                duplicates.append((i, j))
-
-    return duplicates
+    # A non-positive threshold matches disjoint sets, which no index can find
+    if method == "brute" or threshold <= 0:
+        return _find_duplicates_brute(ngrams, threshold)
+    return _find_duplicates_indexed(ngrams, threshold)
 
 
 def dedupe_saas(
     items: List[schema.SaaSIdeaItem],
     threshold: float = 0.7,
+    method: str = "indexed",
 ) -> List[schema.SaaSIdeaItem]:
     """Remove near-duplicates, keeping highest-scored item.
 
     Args:
         items: List of items (should be pre-sorted by score descending)
         threshold: Similarity threshold
+        method: Duplicate finder, 'indexed' or 'brute'
 
     Returns:
         Deduplicated items
@@ -74,7 +108,7 @@ def dedupe_saas(
     if len(items) <= 1:
         return items
 
-    dup_pairs = find_duplicates(items, threshold)
+    dup_pairs = find_duplicates(items, threshold, method)
 
     to_remove = set()
     for i, j in dup_pairs:
@@ -0,0 +1,81 @@
+"""Shared text feature extraction for clustering and dedupe."""
+
+import re
+import zlib
+from typing import Any, Dict, FrozenSet, Set, Tuple
+
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_SPACE_RE = re.compile(r'\s+')
+
+# Attribute used to memoize features on an item
+_CACHE_ATTR = "_features"
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for comparison."""
+    text = text.lower()
+    text = _PUNCT_RE.sub(' ', text)
+    text = _SPACE_RE.sub(' ', text)
+    return text.strip()
+
+
+def get_ngrams(text: str, n: int = 3) -> Set[str]:
+    """Get character n-grams from text."""
+    text = normalize_text(text)
+    if len(text) < n:
+        return {text}
+    return {text[i:i+n] for i in range(len(text) - n + 1)}
+
+
+def hash_ngrams(normalized: str, n: int = 3) -> FrozenSet[int]:
+    """Get CRC32-hashed character n-grams from already normalized text.
+
+    Integer shingles intersect faster than strings and are stable
+    across runs, unlike the builtin str hash.
+    """
+    if len(normalized) < n:
+        return frozenset((zlib.crc32(normalized.encode('utf-8')),))
+    return frozenset(
+        zlib.crc32(normalized[i:i+n].encode('utf-8'))
+        for i in range(len(normalized) - n + 1)
+    )
+
+
+def jaccard_similarity(set1: Set[Any], set2: Set[Any]) -> float:
+    """Compute Jaccard similarity between two sets."""
+    if not set1 or not set2:
+        return 0.0
+    intersection = len(set1 & set2)
+    union = len(set1) + len(set2) - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+def text_features(item: Any, field: str, n: int = 3) -> Tuple[str, FrozenSet[int]]:
+    """Get normalized text and hashed n-grams for an item field.
+
+    Results are memoized on the item and recomputed only if the field
+    text changes, so clustering and dedupe share one extraction pass.
+
+    Args:
+        item: Object with the text attribute (e.g. SaaSIdeaItem)
+        field: Attribute name ('title', 'idea_summary', ...)
+        n: n-gram size
+
+    Returns:
+        Tuple of (normalized_text, hashed_ngrams)
+    """
+    text = getattr(item, field, "") or ""
+    memo: Dict[Tuple[str, int], Tuple[str, str, FrozenSet[int]]] = item.__dict__.setdefault(_CACHE_ATTR, {})
+    cached = memo.get((field, n))
+    if cached is not None and cached[0] == text:
+        return cached[1], cached[2]
+
+    normalized = normalize_text(text)
+    shingles = hash_ngrams(normalized, n)
+    memo[(field, n)] = (text, normalized, shingles)
+    return normalized, shingles
+
+
+def shingles(item: Any, field: str, n: int = 3) -> FrozenSet[int]:
+    """Get memoized hashed n-grams for an item field."""
+    return text_features(item, field, n)[1]
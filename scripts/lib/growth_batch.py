@@ -0,0 +1,199 @@
+"""Batch growth computation over packed post arrays.
+
+Computes GrowthSignals for many subreddits at once from timestamps and
+scores packed into flat arrays with per-subreddit offsets. The growth
+scan packs every scanned subreddit's stored history and computes all
+signals in one pass (growth_from_store). Uses NumPy when it is
+installed; the pure-Python fallback produces identical values, so
+NumPy is never required.
+"""
+
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from . import growth_store, schema, subreddit_growth
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def _log(msg: str):
+    """Log to stderr."""
+    sys.stderr.write(f"[GROWTH] {msg}\n")
+    sys.stderr.flush()
+
+
+class PackedPosts(NamedTuple):
+    """Posts for many subreddits in flat arrays.
+
+    Posts of subreddits[i] are created[offsets[i]:offsets[i + 1]] (and
+    the same slice of scores).
+    """
+    subreddits: List[str]
+    created: array  # 'd' created_utc
+    scores: array   # 'd' score
+    offsets: array  # 'q', len(subreddits) + 1
+
+
+def pack_store(store: growth_store.GrowthStore, since: Dict[str, float]) -> PackedPosts:
+    """Pack each subreddit's stored posts newer than since[subreddit]."""
+    subreddits = list(since)
+    created = array("d")
+    scores = array("d")
+    offsets = array("q", [0])
+    for sub in subreddits:
+        for ts, score in store.post_rows(sub, since[sub]):
+            created.append(ts)
+            scores.append(score)
+        offsets.append(len(created))
+    return PackedPosts(subreddits, created, scores, offsets)
+
+
+Bounds = Union[float, Sequence[float]]
+
+
+def _per_subreddit(value: Bounds, n: int) -> List[float]:
+    return [value] * n if isinstance(value, (int, float)) else list(value)
+
+
+def _window_counts_python(packed: PackedPosts, cutoffs: List[float], midpoints: List[float]) -> List[Tuple[int, float, int, float]]:
+    counts = []
+    created, scores = packed.created, packed.scores
+    for i in range(len(packed.subreddits)):
+        cutoff, midpoint = cutoffs[i], midpoints[i]
+        recent_count = older_count = 0
+        recent_score = older_score = 0.0
+        for j in range(packed.offsets[i], packed.offsets[i + 1]):
+            ts = created[j]
+            if ts >= midpoint:
+                recent_count += 1
+                recent_score += scores[j]
+            elif ts >= cutoff:
+                older_count += 1
+                older_score += scores[j]
+        counts.append((recent_count, recent_score, older_count, older_score))
+    return counts
+
+
+def _window_counts_numpy(packed: PackedPosts, cutoffs: List[float], midpoints: List[float]) -> List[Tuple[int, float, int, float]]:
+    n = len(packed.subreddits)
+    created = np.frombuffer(packed.created, dtype=np.float64)
+    scores = np.frombuffer(packed.scores, dtype=np.float64)
+    offsets = np.frombuffer(packed.offsets, dtype=np.int64)
+    segment = np.repeat(np.arange(n), np.diff(offsets))
+
+    recent = created >= np.asarray(midpoints, dtype=np.float64)[segment]
+    older = (created >= np.asarray(cutoffs, dtype=np.float64)[segment]) & ~recent
+    # bincount sums in input order, matching the Python loop exactly
+    recent_count = np.bincount(segment[recent], minlength=n)
+    older_count = np.bincount(segment[older], minlength=n)
+    recent_score = np.bincount(segment[recent], weights=scores[recent], minlength=n)
+    older_score = np.bincount(segment[older], weights=scores[older], minlength=n)
+
+    return [
+        (int(rc), float(rs), int(oc), float(os))
+        for rc, rs, oc, os in zip(recent_count, recent_score, older_count, older_score)
+    ]
+
+
+def window_counts(
+    packed: PackedPosts,
+    cutoff: Bounds,
+    midpoint: Bounds,
+    use_numpy: Optional[bool] = None,
+) -> List[Tuple[int, float, int, float]]:
+    """Per-subreddit (recent_count, recent_score, older_count, older_score).
+
+    Recent is [midpoint, inf), older is [cutoff, midpoint).
+
+    Args:
+        packed: Packed posts
+        cutoff: Start of the older window (epoch seconds), one for all
+            subreddits or one per subreddit
+        midpoint: Start of the recent window, likewise
+        use_numpy: Force (True) or avoid (False) NumPy; default when installed
+    """
+    if use_numpy is None:
+        use_numpy = HAS_NUMPY
+    if use_numpy and not HAS_NUMPY:
+        raise ImportError("NumPy is not installed")
+    n = len(packed.subreddits)
+    cutoffs, midpoints = _per_subreddit(cutoff, n), _per_subreddit(midpoint, n)
+    if use_numpy:
+        return _window_counts_numpy(packed, cutoffs, midpoints)
+    return _window_counts_python(packed, cutoffs, midpoints)
+
+
+def compute_growth_batch(
+    abouts: Dict[str, Dict[str, Any]],
+    packed: PackedPosts,
+    days: int = 180,
+    now: Optional[float] = None,
+    use_numpy: Optional[bool] = None,
+    windows: Optional[Dict[str, int]] = None,
+) -> List[schema.GrowthSignal]:
+    """Compute growth for every packed subreddit in one pass.
+
+    Produces the same GrowthSignal as subreddit_growth.compute_growth
+    would for each subreddit's posts.
+
+    Args:
+        abouts: Subreddit -> about data (subscribers, active_users)
+        packed: Packed posts (see pack_store)
+        days: Total window in days
+        now: Reference time (default: current time)
+        use_numpy: See window_counts
+        windows: Per-subreddit window in days, overriding days
+
+    Returns:
+        GrowthSignals in packed.subreddits order
+    """
+    if now is None:
+        now = datetime.now(timezone.utc).timestamp()
+    spans = [(windows or {}).get(sub, days) for sub in packed.subreddits]
+    midpoints = [now - (span / 2 * 86400) for span in spans]
+    cutoffs = [now - (span * 86400) for span in spans]
+    counts = window_counts(packed, cutoffs, midpoints, use_numpy)
+    return [
+        subreddit_growth.growth_from_counts(abouts.get(sub, {}), sub, *c, window_days=int(span))
+        for sub, c, span in zip(packed.subreddits, counts, spans)
+    ]
+
+
+def growth_from_store(
+    store: growth_store.GrowthStore,
+    abouts: Dict[str, Dict[str, Any]],
+    days: int = 180,
+    use_numpy: Optional[bool] = None,
+) -> List[schema.GrowthSignal]:
+    """Compute growth from stored history.
+
+    Each subreddit's window shrinks to the span the store has complete
+    history for (see subreddit_growth.growth_window); subreddits with
+    too little history get no signal.
+
+    Args:
+        store: Growth history store
+        abouts: Subreddit -> about data, for every scanned subreddit
+        days: Total window in days
+        use_numpy: See window_counts
+
+    Returns:
+        GrowthSignals in abouts order, minus skipped subreddits
+    """
+    now = datetime.now(timezone.utc).timestamp()
+    windows = {}
+    for sub in abouts:
+        window = subreddit_growth.growth_window(now, days, store.history_start(sub))
+        if window is None:
+            _log(f"r/{sub}: under {subreddit_growth.MIN_HISTORY_DAYS} days of complete post history, skipping")
+            continue
+        windows[sub] = window
+    packed = pack_store(store, {sub: now - window * 86400 for sub, window in windows.items()})
+    return compute_growth_batch(abouts, packed, days, now, use_numpy, windows)
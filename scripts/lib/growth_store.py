@@ -0,0 +1,271 @@
+"""Persistent subreddit growth history for saas-radar skill (stdlib sqlite3).
+
+Each growth scan stores the posts it saw and records how far back the
+stored post history is complete (Reddit listings stop at ~1000 posts,
+so for busy subreddits that starts well inside the 180-day window).
+Growth is then computed from the accumulated post history instead of
+a single listing page, and later scans only need posts from the last
+few days before the newest stored one (re-reading those refreshes
+their scores).
+
+The discovered table is the subreddit discovery seen-set: every
+subreddit ever mentioned, its weighted mention score, and when (and
+with what result) its sidebar and related links were last crawled.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from . import cache
+
+STORE_PATH = cache.CACHE_DIR / "growth.db"
+RETENTION_DAYS = 400  # Posts older than this are pruned
+
+_SCHEMA = """
+DROP TABLE IF EXISTS snapshots;
+CREATE TABLE IF NOT EXISTS posts (
+    subreddit TEXT NOT NULL,
+    post_id TEXT NOT NULL,
+    created_utc REAL NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (subreddit, post_id)
+);
+CREATE INDEX IF NOT EXISTS posts_by_time ON posts (subreddit, created_utc);
+CREATE TABLE IF NOT EXISTS coverage (
+    subreddit TEXT PRIMARY KEY,
+    since REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS discovered (
+    subreddit TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    score REAL NOT NULL DEFAULT 0,
+    mentions INTEGER NOT NULL DEFAULT 0,
+    first_seen INTEGER NOT NULL,
+    last_seen INTEGER NOT NULL,
+    expanded_at INTEGER,
+    status TEXT,
+    subscribers INTEGER,
+    active_users INTEGER
+);
+CREATE INDEX IF NOT EXISTS discovered_by_score ON discovered (score);
+"""
+
+
+class GrowthStore:
+    """SQLite store of subreddit post history.
+
+    One connection is shared by all threads and serialized with a
+    lock; every write is a short transaction. Subreddit names are
+    stored lowercased.
+    """
+
+    def __init__(self, path: Path = STORE_PATH):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self):
+        with self.lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def record_posts(self, subreddit: str, posts: List[Dict[str, Any]]) -> int:
+        """Insert or update posts (dicts with id, created_utc, score).
+
+        Posts without an id are skipped. Known posts are overwritten,
+        which is how re-crawled posts get their scores refreshed.
+
+        Returns:
+            Number of posts written
+        """
+        rows = [
+            (subreddit.lower(), p["id"], p["created_utc"], p.get("score", 0))
+            for p in posts if p.get("id") and p.get("created_utc")
+        ]
+        if not rows:
+            return 0
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def newest_post(self, subreddit: str) -> Optional[Dict[str, Any]]:
+        """Most recent stored post for a subreddit (id and created_utc)."""
+        with self.lock:
+            row = self._connect().execute(
+                "SELECT post_id, created_utc FROM posts WHERE subreddit = ? "
+                "ORDER BY created_utc DESC LIMIT 1",
+                (subreddit.lower(),),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"id": row[0], "created_utc": row[1]}
+
+    def history_start(self, subreddit: str) -> Optional[float]:
+        """created_utc from which every post of a subreddit is stored.
+
+        Falls back to the oldest stored post for history recorded
+        before coverage was tracked. None if nothing is stored.
+        """
+        with self.lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT since FROM coverage WHERE subreddit = ?", (subreddit.lower(),),
+            ).fetchone()
+            if row is None:
+                row = conn.execute(
+                    "SELECT MIN(created_utc) FROM posts WHERE subreddit = ?", (subreddit.lower(),),
+                ).fetchone()
+        return row[0] if row else None
+
+    def record_crawl(self, subreddit: str, reached: float, joined: bool):
+        """Update history coverage after a crawl.
+
+        Args:
+            subreddit: Subreddit name
+            reached: The crawl saw every post newer than this
+            joined: The crawl reached already-stored posts, so the
+                stored history before it is still contiguous
+        """
+        since = reached
+        if joined:
+            previous = self.history_start(subreddit)
+            if previous is not None:
+                since = min(previous, reached)
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO coverage VALUES (?, ?)", (subreddit.lower(), since),
+                )
+
+    def post_rows(self, subreddit: str, since: float) -> List[tuple]:
+        """(created_utc, score) of posts since a timestamp, oldest first."""
+        with self.lock:
+            return self._connect().execute(
+                "SELECT created_utc, score FROM posts WHERE subreddit = ? AND created_utc >= ? "
+                "ORDER BY created_utc",
+                (subreddit.lower(), since),
+            ).fetchall()
+
+    def record_discoveries(self, mentions: Dict[str, int], weight: float = 1.0) -> int:
+        """Add subreddit mentions to the discovery seen-set.
+
+        Unknown subreddits join the frontier; known ones gain score.
+
+        Args:
+            mentions: Subreddit name -> number of mentions
+            weight: Score added per mention
+
+        Returns:
+            Number of subreddits not seen before
+        """
+        now = int(time.time())
+        added = 0
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                for name, count in mentions.items():
+                    added += conn.execute(
+                        "INSERT OR IGNORE INTO discovered (subreddit, name, first_seen, last_seen) "
+                        "VALUES (?, ?, ?, ?)",
+                        (name.lower(), name, now, now),
+                    ).rowcount
+                    conn.execute(
+                        "UPDATE discovered SET score = score + ?, mentions = mentions + ?, "
+                        "last_seen = ? WHERE subreddit = ?",
+                        (weight * count, count, now, name.lower()),
+                    )
+        return added
+
+    def discovery_frontier(self, limit: int, expanded_before: float) -> List[str]:
+        """Subreddits to crawl next: never expanded first, then stale, by score.
+
+        Subreddits found to be missing or NSFW are never re-crawled.
+        """
+        with self.lock:
+            rows = self._connect().execute(
+                "SELECT name FROM discovered "
+                "WHERE (expanded_at IS NULL OR expanded_at < ?) "
+                "AND (status IS NULL OR status NOT IN ('missing', 'nsfw')) "
+                "ORDER BY expanded_at IS NOT NULL, score DESC LIMIT ?",
+                (int(expanded_before), limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def mark_expanded(
+        self,
+        subreddit: str,
+        status: str,
+        name: Optional[str] = None,
+        subscribers: Optional[int] = None,
+        active_users: Optional[int] = None,
+    ):
+        """Record the result of crawling a subreddit's about/related links."""
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE discovered SET expanded_at = ?, status = ?, name = COALESCE(?, name), "
+                    "subscribers = ?, active_users = ? WHERE subreddit = ?",
+                    (int(time.time()), status, name, subscribers, active_users, subreddit.lower()),
+                )
+
+    def discovery_candidates(self, limit: int) -> List[Dict[str, Any]]:
+        """Verified ('ok') discovered subreddits, best score first."""
+        with self.lock:
+            rows = self._connect().execute(
+                "SELECT name, score, mentions, subscribers FROM discovered WHERE status = 'ok' "
+                "ORDER BY score DESC, subscribers DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            {"name": name, "score": score, "mentions": mentions, "subscribers": subs}
+            for name, score, mentions, subs in rows
+        ]
+
+    def prune_discoveries(self, max_rows: int):
+        """Keep only the max_rows best-scored subreddits in the seen-set."""
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM discovered WHERE subreddit IN ("
+                    "SELECT subreddit FROM discovered ORDER BY score DESC, last_seen DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (max_rows,),
+                )
+
+    def prune(self, retention_days: int = RETENTION_DAYS):
+        """Delete posts older than the retention window."""
+        cutoff = time.time() - retention_days * 86400
+        with self.lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM posts WHERE created_utc < ?", (cutoff,))
+
+
+_default_store: Optional[GrowthStore] = None
+_default_lock = threading.Lock()
+
+
+def get_store() -> GrowthStore:
+    """Get the process-wide store at STORE_PATH."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = GrowthStore()
+        return _default_store
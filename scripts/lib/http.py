@@ -1,13 +1,23 @@
 """HTTP utilities for saas-radar skill (stdlib only)."""
 
+import base64
+import http.client as http_client
 import json
 import os
+import random
+import socket
 import sys
+import threading
 import time
-import urllib.error
-import urllib.request
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode
+import zlib
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlencode, urljoin, urlsplit, urlunsplit
+from urllib.request import getproxies, proxy_bypass
+
+from . import cache, ratelimit, timing
 
 DEFAULT_TIMEOUT = 30
 DEBUG = os.environ.get("SAAS_RADAR_DEBUG", "").lower() in ("1", "true", "yes")
@@ -19,9 +29,28 @@ def log(msg: str):
         sys.stderr.write(f"[DEBUG] {msg}\n")
         sys.stderr.flush()
 MAX_RETRIES = 3
-RETRY_DELAY = 1.0
+RETRY_DELAY = 1.0  # Base delay for exponential backoff
+MAX_RETRY_DELAY = 30.0  # Cap on a single backoff sleep
+RETRY_BUDGET = 60.0  # Max total seconds spent sleeping between retries
 USER_AGENT = "saas-radar/1.0 (Claude Code Skill)"
 
+# Connection pool settings
+MAX_CONNECTIONS_PER_HOST = 10
+POOL_IDLE_TIMEOUT = 60.0  # Seconds before an idle connection is evicted
+MAX_REDIRECTS = 5
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Circuit breaker: open a host's circuit when at least BREAKER_MIN_CALLS
+# attempts in the last BREAKER_WINDOW seconds failed at BREAKER_FAILURE_RATE
+BREAKER_WINDOW = 60.0
+BREAKER_MIN_CALLS = 4
+BREAKER_FAILURE_RATE = 0.5
+BREAKER_OPEN_SECONDS = 30.0  # Fast-fail period before a half-open probe
+
+# Compressed transfer
+ACCEPT_ENCODING = "gzip, deflate"
+READ_CHUNK_SIZE = 64 * 1024
+
 
 class HTTPError(Exception):
     """HTTP request error with status code."""
@@ -31,13 +60,470 @@ class HTTPError(Exception):
         self.body = body
 
 
+class CircuitOpenError(HTTPError):
+    """Request refused without a network call because the host's circuit is open."""
+
+
+def proxy_for(scheme: str, host: str) -> Optional[str]:
+    """Proxy URL for a target host, or None to connect directly.
+
+    Follows urllib: HTTP_PROXY/HTTPS_PROXY via getproxies() and
+    NO_PROXY via proxy_bypass().
+
+    Raises:
+        HTTPError: If the proxy URL is not http:// (TLS to the proxy
+            itself is not supported)
+    """
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        return f"http://{proxy}"
+    parts = urlsplit(proxy)
+    if parts.scheme.lower() != "http":
+        raise HTTPError(
+            f"Unsupported {parts.scheme}:// proxy {parts.hostname} for {scheme} requests: "
+            "only http:// proxies are supported"
+        )
+    return proxy
+
+
+def _proxy_auth(proxy: str) -> Dict[str, str]:
+    """Proxy-Authorization header for credentials embedded in a proxy URL."""
+    parts = urlsplit(proxy)
+    if not parts.username:
+        return {}
+    creds = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(creds.encode()).decode("ascii")}
+
+
+class ConnectionPool:
+    """Per-host pool of keep-alive HTTP(S) connections.
+
+    Connections are checked out under a lock, returned after a fully
+    read response, and evicted once idle longer than idle_timeout.
+    At most max_per_host connections per host exist at a time; extra
+    callers wait for one to be released. When proxy_for() names a
+    proxy (http:// only), HTTPS connections tunnel through it with
+    CONNECT and HTTP connections go to the proxy itself.
+    """
+
+    def __init__(self, max_per_host: int = MAX_CONNECTIONS_PER_HOST, idle_timeout: float = POOL_IDLE_TIMEOUT):
+        self.max_per_host = max_per_host
+        self.idle_timeout = idle_timeout
+        self.lock = threading.Lock()
+        self.idle: Dict[Tuple[str, str, int], List[Tuple[http_client.HTTPConnection, float]]] = {}
+        self.slots: Dict[Tuple[str, str, int], threading.BoundedSemaphore] = {}
+
+    def _slot(self, key: Tuple[str, str, int]) -> threading.BoundedSemaphore:
+        with self.lock:
+            if key not in self.slots:
+                self.slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return self.slots[key]
+
+    def checkout(self, scheme: str, host: str, port: int, timeout: float) -> Tuple[http_client.HTTPConnection, bool]:
+        """Get a connection for a host.
+
+        Returns:
+            Tuple of (connection, reused) where reused is True for a
+            pooled keep-alive connection
+
+        Raises:
+            HTTPError: If the configured proxy is unsupported
+        """
+        proxy = proxy_for(scheme, host)
+        key = (scheme, host, port)
+        self._slot(key).acquire()
+
+        conn = None
+        now = time.monotonic()
+        with self.lock:
+            idle = self.idle.get(key, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    conn = candidate
+                    break
+                candidate.close()
+
+        if conn is not None:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+
+        conn_class = http_client.HTTPSConnection if scheme == "https" else http_client.HTTPConnection
+        if proxy is None:
+            return conn_class(host, port, timeout=timeout), False
+        proxy_parts = urlsplit(proxy)
+        conn = conn_class(proxy_parts.hostname, proxy_parts.port or 80, timeout=timeout)
+        if scheme == "https":
+            conn.set_tunnel(host, port, headers=_proxy_auth(proxy))
+        return conn, False
+
+    def release(self, scheme: str, host: str, port: int, conn: http_client.HTTPConnection, reusable: bool):
+        """Return a connection to the pool, or close it if not reusable."""
+        key = (scheme, host, port)
+        if reusable and conn.sock is not None:
+            with self.lock:
+                self.idle.setdefault(key, []).append((conn, time.monotonic()))
+        else:
+            conn.close()
+        self._slot(key).release()
+
+    def close_all(self):
+        """Close every idle connection."""
+        with self.lock:
+            for conns in self.idle.values():
+                for conn, _ in conns:
+                    conn.close()
+            self.idle.clear()
+
+
+_pool = ConnectionPool()
+
+
+class StreamDecoder:
+    """Incremental Content-Encoding decoder (gzip, deflate or identity).
+
+    Chunks are decompressed as they arrive, so a compressed body is
+    never held in full alongside its decoded form. Counts bytes before
+    (wire_bytes) and after (decoded_bytes) decoding.
+    """
+
+    def __init__(self, encoding: Optional[str]):
+        self.encoding = (encoding or "").strip().lower()
+        if self.encoding in ("gzip", "x-gzip"):
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == "deflate":
+            self._obj = zlib.decompressobj()
+        else:
+            self._obj = None
+        self._raw_deflate_checked = False
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Decode one chunk of body bytes."""
+        self.wire_bytes += len(chunk)
+        if self._obj is None:
+            out = chunk
+        else:
+            try:
+                try:
+                    out = self._obj.decompress(chunk)
+                except zlib.error:
+                    # Some servers send raw deflate without the zlib header
+                    if self.encoding != "deflate" or self._raw_deflate_checked:
+                        raise
+                    self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+                    out = self._obj.decompress(chunk)
+            except zlib.error as e:
+                raise HTTPError(f"Invalid {self.encoding} response body: {e}")
+            self._raw_deflate_checked = True
+        self.decoded_bytes += len(out)
+        return out
+
+    def flush(self) -> bytes:
+        """Return any bytes still buffered in the decompressor."""
+        try:
+            out = self._obj.flush() if self._obj is not None else b""
+        except zlib.error as e:
+            raise HTTPError(f"Invalid {self.encoding} response body: {e}")
+        self.decoded_bytes += len(out)
+        return out
+
+    def log_sizes(self):
+        """Debug-log wire vs decoded sizes for compressed bodies."""
+        if self._obj is not None:
+            ratio = self.decoded_bytes / self.wire_bytes if self.wire_bytes else 0.0
+            log(f"Decoded {self.encoding}: {self.wire_bytes} -> {self.decoded_bytes} bytes ({ratio:.1f}x)")
+
+
+class CircuitBreaker:
+    """Per-host failure-rate circuit breaker, shared across threads.
+
+    closed: requests flow; attempt outcomes are kept for `window`
+    seconds. Once at least min_calls were seen and the failure share
+    reaches failure_rate, the circuit opens.
+    open: every request fails fast with CircuitOpenError for
+    open_seconds, then the circuit goes half-open.
+    half_open: a single probe request is let through; success closes
+    the circuit, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        window: float = BREAKER_WINDOW,
+        min_calls: int = BREAKER_MIN_CALLS,
+        failure_rate: float = BREAKER_FAILURE_RATE,
+        open_seconds: float = BREAKER_OPEN_SECONDS,
+    ):
+        self.host = host
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.open_seconds = open_seconds
+        self.state = "closed"
+        self.opened_at = 0.0
+        self.probing = False
+        self.outcomes: deque = deque()  # (monotonic time, ok)
+        self.lock = threading.Lock()
+
+    def before_request(self):
+        """Check the circuit before an attempt.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (or a half-open
+                probe is already in flight)
+        """
+        with self.lock:
+            if self.state == "open":
+                if time.monotonic() - self.opened_at < self.open_seconds:
+                    raise CircuitOpenError(f"Circuit open for {self.host}")
+                self.state = "half_open"
+                self.probing = False
+            if self.state == "half_open":
+                if self.probing:
+                    raise CircuitOpenError(f"Circuit half-open for {self.host}, probe in flight")
+                self.probing = True
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently being refused."""
+        with self.lock:
+            return self.state == "open" and time.monotonic() - self.opened_at < self.open_seconds
+
+    def record(self, ok: bool):
+        """Record an attempt outcome and update the circuit state."""
+        with self.lock:
+            now = time.monotonic()
+            if self.state == "half_open":
+                self.probing = False
+                if ok:
+                    log(f"Circuit closed for {self.host}")
+                    self.state = "closed"
+                    self.outcomes.clear()
+                else:
+                    self._open(now)
+                return
+
+            self.outcomes.append((now, ok))
+            while self.outcomes and now - self.outcomes[0][0] > self.window:
+                self.outcomes.popleft()
+            failures = sum(1 for _, good in self.outcomes if not good)
+            if (
+                self.state == "closed"
+                and len(self.outcomes) >= self.min_calls
+                and failures / len(self.outcomes) >= self.failure_rate
+            ):
+                self._open(now)
+
+    def _open(self, now: float):
+        log(f"Circuit open for {self.host} ({self.open_seconds:.0f}s)")
+        self.state = "open"
+        self.opened_at = now
+        self.outcomes.clear()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a host."""
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]
+
+
+def is_failure_status(status: Optional[int]) -> bool:
+    """Whether an attempt outcome counts against the circuit breaker.
+
+    Connection errors and 5xx count; 4xx (including 429, which the
+    rate limiter handles) mean the upstream is up.
+    """
+    return status is None or status >= 500
+
+
+class RetryPolicy:
+    """How request() retries failed calls to one host.
+
+    Server hints (Retry-After, Reddit's x-ratelimit-reset) win over
+    backoff; otherwise the delay is full-jitter exponential backoff,
+    uniform in [0, min(max_delay, base_delay * 2**attempt)]. Retries
+    stop once the next sleep would exceed the total budget.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_RETRIES,
+        base_delay: float = RETRY_DELAY,
+        max_delay: float = MAX_RETRY_DELAY,
+        budget: float = RETRY_BUDGET,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+
+    def should_retry(self, status: Optional[int]) -> bool:
+        """Retry connection errors (status None), 429s and 5xx."""
+        return status is None or status == 429 or status >= 500
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for a 0-based attempt number."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def delay(self, attempt: int, status: Optional[int], headers: Optional[Dict[str, str]]) -> float:
+        """Seconds to wait before the next attempt."""
+        hinted = retry_after_seconds(status, headers)
+        if hinted is not None:
+            return hinted
+        return self.backoff(attempt)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# Reddit throttles unauthenticated clients hard and says when to come
+# back; LLM APIs can take a while to recover from 5xx/overload.
+RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    "www.reddit.com": RetryPolicy(max_attempts=4, base_delay=2.0, max_delay=60.0, budget=90.0),
+    "api.openai.com": RetryPolicy(max_attempts=3, base_delay=2.0, max_delay=30.0, budget=60.0),
+    "api.x.ai": RetryPolicy(max_attempts=3, base_delay=2.0, max_delay=30.0, budget=60.0),
+}
+
+
+def get_retry_policy(host: str) -> RetryPolicy:
+    """Get the retry policy for a host (DEFAULT_RETRY_POLICY if unset)."""
+    return RETRY_POLICIES.get(host, DEFAULT_RETRY_POLICY)
+
+
+def retry_after_seconds(status: Optional[int], headers: Optional[Dict[str, str]]) -> Optional[float]:
+    """Read how long the server asked us to wait, if it said.
+
+    Honors Retry-After (delta-seconds or HTTP-date) and, when the quota
+    is exhausted or the response is a 429, Reddit's x-ratelimit-reset
+    (seconds until the window resets).
+
+    Args:
+        status: Response status, or None for connection errors
+        headers: Response headers (any case)
+
+    Returns:
+        Seconds to wait, or None if the server gave no hint
+    """
+    if not headers:
+        return None
+    lowered = {k.lower(): v for k, v in headers.items()}
+
+    retry_after = lowered.get("retry-after")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(retry_after)
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError, IndexError):
+            pass
+
+    quota = ratelimit.parse_quota_headers(lowered)
+    if quota is None:
+        return None
+    remaining, reset = quota
+    if status == 429 or remaining < 1:
+        return max(0.0, reset)
+    return None
+
+
+def close_connections():
+    """Close all pooled keep-alive connections."""
+    _pool.close_all()
+
+
+def _send(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[bytes],
+    timeout: float,
+) -> Tuple[int, str, bytes, Dict[str, str], int]:
+    """Send one request over a pooled connection, following redirects.
+
+    Compressed bodies are decoded while being read.
+
+    Returns:
+        Tuple of (status, reason, decoded body bytes, response headers,
+        bytes received on the wire)
+    """
+    wire_bytes = 0
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        scheme = parts.scheme or "https"
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        send_headers = headers
+        proxy = proxy_for(scheme, host) if scheme == "http" else None
+        if proxy:
+            # Plain HTTP through a proxy: absolute URI, credentials per request
+            path = urlunsplit((scheme, parts.netloc, parts.path or "/", parts.query, ""))
+            send_headers = {**headers, **_proxy_auth(proxy)}
+
+        conn, reused = _pool.checkout(scheme, host, port, timeout)
+        reusable = False
+        try:
+            try:
+                conn.request(method, path, body=data, headers=send_headers)
+                response = conn.getresponse()
+            except (http_client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                if not reused:
+                    raise
+                # Server dropped an idle keep-alive connection; retry fresh
+                conn.close()
+                conn.connect()
+                conn.request(method, path, body=data, headers=send_headers)
+                response = conn.getresponse()
+            decoder = StreamDecoder(response.getheader("Content-Encoding"))
+            parts_out = []
+            for chunk in iter(lambda: response.read(READ_CHUNK_SIZE), b""):
+                parts_out.append(decoder.feed(chunk))
+            parts_out.append(decoder.flush())
+            body = b"".join(parts_out)
+            wire_bytes += decoder.wire_bytes
+            decoder.log_sizes()
+            reusable = not response.will_close
+        finally:
+            _pool.release(scheme, host, port, conn, reusable)
+
+        location = response.getheader("Location")
+        if response.status in REDIRECT_CODES and location:
+            url = urljoin(url, location)
+            if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                method, data = "GET", None
+            continue
+
+        return response.status, response.reason, body, dict(response.getheaders()), wire_bytes
+
+    raise HTTPError(f"Too many redirects: {url}")
+
+
 def request(
     method: str,
     url: str,
     headers: Optional[Dict[str, str]] = None,
     json_data: Optional[Dict[str, Any]] = None,
     timeout: int = DEFAULT_TIMEOUT,
-    retries: int = MAX_RETRIES,
+    retries: Optional[int] = None,
+    conditional: bool = False,
 ) -> Dict[str, Any]:
     """Make an HTTP request and return JSON response.
 
@@ -47,7 +533,10 @@ def request(
         headers: Optional headers dict
         json_data: Optional JSON body (for POST)
         timeout: Request timeout in seconds
-        retries: Number of retries on failure
+        retries: Max attempts (default: the host's RetryPolicy)
+        conditional: For GETs, revalidate against the validator cache
+            (If-None-Match/If-Modified-Since) and reuse the cached body
+            on 304 Not Modified
 
     Returns:
         Parsed JSON response
@@ -55,65 +544,150 @@ def request(
     Raises:
         HTTPError: On request failure
     """
-    headers = headers or {}
+    headers = dict(headers or {})
     headers.setdefault("User-Agent", USER_AGENT)
+    headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
 
     data = None
     if json_data is not None:
         data = json.dumps(json_data).encode('utf-8')
         headers.setdefault("Content-Type", "application/json")
 
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
-
     log(f"{method} {url}")
     if json_data:
         log(f"Payload keys: {list(json_data.keys())}")
 
+    stats = {"status": None, "bytes": 0, "decoded_bytes": 0, "attempts": 0}
+    started = time.monotonic()
+    try:
+        return _request_with_retries(
+            method, url, headers, data, timeout, retries, stats,
+            conditional and method == "GET",
+        )
+    finally:
+        timing.record_request(
+            method, url, stats["status"], time.monotonic() - started,
+            stats["bytes"], max(stats["attempts"] - 1, 0), stats["decoded_bytes"],
+        )
+
+
+def _request_with_retries(
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    data: Optional[bytes],
+    timeout: int,
+    retries: Optional[int],
+    stats: Dict[str, Any],
+    conditional: bool = False,
+) -> Dict[str, Any]:
+    """Run the retry loop for request(), updating stats as it goes."""
+    cached = add_validators(url, headers) if conditional else None
+    host = urlsplit(url).hostname or ""
+    policy = get_retry_policy(host)
+    breaker = get_circuit_breaker(host)
+    max_attempts = retries if retries is not None else policy.max_attempts
+    slept = 0.0
     last_error = None
-    for attempt in range(retries):
+    for attempt in range(max_attempts):
+        status = None
+        response_headers = None
+        breaker.before_request()
         try:
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                body = response.read().decode('utf-8')
-                log(f"Response: {response.status} ({len(body)} bytes)")
-                return json.loads(body) if body else {}
-        except urllib.error.HTTPError as e:
-            body = None
+            stats["attempts"] += 1
+            ratelimit.wait_for_host(host)
             try:
-                body = e.read().decode('utf-8')
-            except:
-                pass
-            log(f"HTTP Error {e.code}: {e.reason}")
-            if body:
-                log(f"Error body: {body[:500]}")
-            last_error = HTTPError(f"HTTP {e.code}: {e.reason}", e.code, body)
-
-            # Don't retry client errors (4xx) except rate limits
-            if 400 <= e.code < 500 and e.code != 429:
-                raise last_error
-
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-        except urllib.error.URLError as e:
-            log(f"URL Error: {e.reason}")
-            last_error = HTTPError(f"URL Error: {e.reason}")
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+                status, reason, raw, response_headers, wire_bytes = _send(method, url, headers, data, timeout)
+            finally:
+                breaker.record(not is_failure_status(status))
+            ratelimit.observe_response(host, response_headers)
+            stats["status"] = status
+            stats["bytes"] += wire_bytes
+            stats["decoded_bytes"] += len(raw)
+            if status >= 400:
+                body = None
+                try:
+                    body = raw.decode('utf-8')
+                except UnicodeDecodeError:
+                    pass
+                log(f"HTTP Error {status}: {reason}")
+                if body:
+                    log(f"Error body: {body[:500]}")
+                last_error = HTTPError(f"HTTP {status}: {reason}", status, body)
+
+                # Don't retry client errors (4xx) except rate limits
+                if not policy.should_retry(status):
+                    raise last_error
+            elif status == 304 and cached is not None:
+                log("Not modified: using cached body")
+                store_validators(url, response_headers, cached["data"], cached)
+                return cached["data"]
+            else:
+                body = raw.decode('utf-8')
+                log(f"Response: {status} ({len(body)} bytes)")
+                result = json.loads(body) if body else {}
+                if conditional:
+                    store_validators(url, response_headers, result)
+                return result
+        except socket.gaierror as e:
+            log(f"URL Error: {e}")
+            last_error = HTTPError(f"URL Error: {e}")
         except json.JSONDecodeError as e:
             log(f"JSON decode error: {e}")
             last_error = HTTPError(f"Invalid JSON response: {e}")
             raise last_error
-        except (OSError, TimeoutError, ConnectionResetError) as e:
+        except (OSError, TimeoutError, ConnectionResetError, http_client.HTTPException) as e:
             # Handle socket-level errors (connection reset, timeout, etc.)
             log(f"Connection error: {type(e).__name__}: {e}")
             last_error = HTTPError(f"Connection error: {type(e).__name__}: {e}")
-            if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+
+        if attempt < max_attempts - 1:
+            if breaker.is_open:
+                break  # No point sleeping just to fail fast
+            delay = policy.delay(attempt, status, response_headers)
+            if slept + delay > policy.budget:
+                log(f"Retry budget exhausted ({slept:.1f}s slept, next wait {delay:.1f}s)")
+                break
+            log(f"Retrying in {delay:.1f}s (attempt {attempt + 2}/{max_attempts})")
+            time.sleep(delay)
+            slept += delay
 
     if last_error:
         raise last_error
     raise HTTPError("Request failed with no error details")
 
 
+def add_validators(url: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Add conditional-GET headers for a URL from the validator cache.
+
+    Returns:
+        The cached entry if one with validators exists, else None
+    """
+    entry = cache.load_http_cache(url)
+    if entry and (entry.get("etag") or entry.get("last_modified")):
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return entry
+    return None
+
+
+def store_validators(
+    url: str,
+    response_headers: Optional[Dict[str, str]],
+    data: Any,
+    previous: Optional[Dict[str, Any]] = None,
+):
+    """Save a response body with its ETag/Last-Modified, if it has any."""
+    lowered = {k.lower(): v for k, v in (response_headers or {}).items()}
+    previous = previous or {}
+    etag = lowered.get("etag") or previous.get("etag")
+    last_modified = lowered.get("last-modified") or previous.get("last_modified")
+    if etag or last_modified:
+        cache.save_http_cache(url, etag, last_modified, data)
+
+
 def get(url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> Dict[str, Any]:
     """Make a GET request."""
     return request("GET", url, headers=headers, **kwargs)
@@ -124,14 +698,14 @@ def post(url: str, json_data: Dict[str, Any], headers: Optional[Dict[str, str]]
     return request("POST", url, headers=headers, json_data=json_data, **kwargs)
 
 
-def get_reddit_json(path: str) -> Dict[str, Any]:
-    """Fetch Reddit thread JSON.
+def reddit_json_url(path: str) -> str:
+    """Build the JSON API URL for a Reddit path.
 
     Args:
         path: Reddit path (e.g., /r/subreddit/comments/id/title)
 
     Returns:
-        Parsed JSON response
+        https://www.reddit.com URL ending in .json with raw_json=1
     """
     # Ensure path starts with /
     if not path.startswith('/'):
@@ -142,7 +716,21 @@ def get_reddit_json(path: str) -> Dict[str, Any]:
     if not path.endswith('.json'):
         path = path + '.json'
 
-    url = f"https://www.reddit.com{path}?raw_json=1"
+    return f"https://www.reddit.com{path}?raw_json=1"
+
+
+def get_reddit_json(path: str) -> Dict[str, Any]:
+    """Fetch Reddit thread JSON.
+
+    Not revalidated: reddit_enrich keeps thread bodies in its own cache.
+
+    Args:
+        path: Reddit path (e.g., /r/subreddit/comments/id/title)
+
+    Returns:
+        Parsed JSON response
+    """
+    url = reddit_json_url(path)
 
     headers = {
         "User-Agent": USER_AGENT,
@@ -1,34 +1,72 @@
 """Idea clustering for market signal detection."""
 
-import re
-from typing import List, Set
-
-from . import schema
-
-
-def normalize_text(text: str) -> str:
-    """Normalize text for comparison."""
-    text = text.lower()
-    text = re.sub(r'[^\w\s]', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+import itertools
+import random
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+from . import features, schema
+from .features import get_ngrams, jaccard_similarity, normalize_text  # noqa: F401 (re-exported)
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency
+    np = None
+
+# MinHash/LSH settings. With b bands of r rows, a pair with Jaccard s
+# becomes a candidate with probability 1 - (1 - s^r)^b; the S-curve's
+# midpoint is (1/b)^(1/r), 0.29 at 40 x 3, next to the 0.3 clustering
+# threshold. Recall per pair is 67% at s = 0.3, 83% at 0.35, 93% at
+# 0.4 and 99.5% at 0.5; transitive Union-Find merges recover most
+# missed borderline pairs. Unrelated summaries (s ~ 0.1) become
+# candidates 4% of the time, s = 0.2 pairs 28%.
+LSH_BANDS = 40
+LSH_ROWS = 3
+LSH_MIN_ITEMS = 200  # Below this, exact all-pairs comparison is cheap enough
+
+# Universal hashes (a * x + b) mod p with p < 2**32: products stay
+# below 2**64, so NumPy (uint64) and pure Python give identical values
+_HASH_PRIME = 4294967291
+_rng = random.Random(1729)
+_HASH_A = [_rng.randrange(1, _HASH_PRIME) for _ in range(LSH_BANDS * LSH_ROWS)]
+_HASH_B = [_rng.randrange(0, _HASH_PRIME) for _ in range(LSH_BANDS * LSH_ROWS)]
+_PERMUTATIONS = list(zip(_HASH_A, _HASH_B))
+if np is not None:
+    _NP_A = np.array(_HASH_A, dtype=np.uint64)[:, None]
+    _NP_B = np.array(_HASH_B, dtype=np.uint64)[:, None]
+
+
+def minhash_signature(shingles: FrozenSet[int]) -> List[int]:
+    """Compute a MinHash signature for a set of hashed shingles.
+
+    Vectorized with NumPy when installed; same values either way.
+    """
+    hashed = [x % _HASH_PRIME for x in shingles] or [0]
+    if np is not None:
+        x = np.array(hashed, dtype=np.uint64)
+        return ((_NP_A * x + _NP_B) % np.uint64(_HASH_PRIME)).min(axis=1).tolist()
+    prime = _HASH_PRIME
+    return [min([(a * x + b) % prime for x in hashed]) for a, b in _PERMUTATIONS]
 
 
-def get_ngrams(text: str, n: int = 3) -> Set[str]:
-    """Get character n-grams from text."""
-    text = normalize_text(text)
-    if len(text) < n:
-        return {text}
-    return {text[i:i+n] for i in range(len(text) - n + 1)}
+def lsh_candidate_pairs(signatures: List[List[int]]) -> Set[Tuple[int, int]]:
+    """Find candidate pairs whose signatures collide in any LSH band.
 
+    Args:
+        signatures: MinHash signatures, one per item
 
-def jaccard_similarity(set1: Set[str], set2: Set[str]) -> float:
-    """Compute Jaccard similarity between two sets."""
-    if not set1 or not set2:
-        return 0.0
-    intersection = len(set1 & set2)
-    union = len(set1 | set2)
-    return intersection / union if union > 0 else 0.0
+    Returns:
+        Set of (i, j) index pairs where i < j
+    """
+    candidates = set()
+    for band in range(LSH_BANDS):
+        start = band * LSH_ROWS
+        buckets: Dict[Tuple[int, ...], List[int]] = {}
+        for idx, sig in enumerate(signatures):
+            buckets.setdefault(tuple(sig[start:start + LSH_ROWS]), []).append(idx)
+        for members in buckets.values():
+            if len(members) > 1:
+                candidates.update(itertools.combinations(members, 2))
+    return candidates
 
 
 def _find_root(parent: List[int], i: int) -> int:
@@ -54,6 +92,7 @@ def _union(parent: List[int], rank: List[int], a: int, b: int):
 def cluster_ideas(
     items: List[schema.SaaSIdeaItem],
     threshold: float = 0.3,
+    method: str = "auto",
 ) -> List[schema.SaaSIdeaItem]:
     """Group similar ideas using Jaccard similarity on idea_summary.
 
@@ -66,9 +105,14 @@ def cluster_ideas(
     - 3 threads = 75
     - 4+ threads = 100 (strong market signal)
 
+    Large inputs use MinHash/LSH to generate candidate pairs; the exact
+    Jaccard threshold is still applied to every candidate.
+
     Args:
         items: List of SaaSIdeaItem
         threshold: Similarity threshold (default 0.3)
+        method: 'exact' (all pairs), 'lsh', or 'auto' (LSH for
+            LSH_MIN_ITEMS or more items)
 
     Returns:
         Items with updated market_signal and cluster_id
@@ -81,19 +125,27 @@ def cluster_ideas(
 
     n = len(items)
 
-    # Pre-compute n-grams for idea_summary
-    ngrams = [get_ngrams(item.idea_summary) for item in items]
+    # Hashed n-grams for idea_summary (memoized on each item)
+    ngrams = [features.shingles(item, "idea_summary") for item in items]
 
     # Union-Find
     parent = list(range(n))
     rank = [0] * n
 
-    # Compare all pairs
-    for i in range(n):
-        for j in range(i + 1, n):
-            sim = jaccard_similarity(ngrams[i], ngrams[j])
-            if sim >= threshold:
-                _union(parent, rank, i, j)
+    use_lsh = method == "lsh" or (method == "auto" and n >= LSH_MIN_ITEMS)
+
+    if use_lsh:
+        # Score only LSH candidate pairs
+        signatures = [minhash_signature(g) for g in ngrams]
+        pairs = sorted(lsh_candidate_pairs(signatures))
+    else:
+        # Compare all pairs
+        pairs = ((i, j) for i in range(n) for j in range(i + 1, n))
+
+    for i, j in pairs:
+        sim = jaccard_similarity(ngrams[i], ngrams[j])
+        if sim >= threshold:
+            _union(parent, rank, i, j)
 
     # Compute cluster sizes
     clusters = {}
@@ -0,0 +1,160 @@
+"""Thread-safe rate limiting for saas-radar skill."""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class TokenBucket:
+    """Token-bucket limiter shared across worker threads.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    acquire() blocks until a token is available, so callers overlap
+    freely while the aggregate request rate stays under the limit.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens now, going into debt if needed.
+
+        Returns:
+            Seconds the caller must wait before proceeding (for callers
+            that sleep themselves, e.g. with asyncio.sleep)
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self, tokens: float = 1.0):
+        """Take tokens, sleeping until they are available."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Hosts paced process-wide: suffix -> (initial rate/s, burst, max rate/s).
+# Reddit's unauthenticated JSON API is the only upstream we hammer;
+# LLM APIs are called a handful of times per run.
+HOST_LIMITS: Dict[str, Tuple[float, float, float]] = {
+    "reddit.com": (1.0, 2, 10.0),
+}
+MIN_RESET_WINDOW = 1.0  # Seconds; avoids huge rates right before a reset
+
+
+class AdaptiveLimiter:
+    """Per-host pacing that follows the server's advertised quota.
+
+    Starts as a token bucket at the configured rate. Every response's
+    remaining/reset headers retune the rate to spread the remaining
+    quota evenly over the rest of the window (capped at max_rate), and
+    an exhausted quota blocks all callers until the window resets.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, max_rate: Optional[float] = None):
+        self.bucket = TokenBucket(rate, capacity)
+        self.max_rate = max_rate if max_rate is not None else rate
+        self.blocked_until = 0.0
+
+    def reserve(self) -> float:
+        """Take a slot now and return seconds to wait before using it."""
+        wait = self.bucket.reserve()
+        with self.bucket.lock:
+            blocked = self.blocked_until - time.monotonic()
+        return max(wait, blocked, 0.0)
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, remaining: float, reset: float):
+        """Retune from a response's remaining quota and seconds to reset."""
+        with self.bucket.lock:
+            now = time.monotonic()
+            if remaining < 1:
+                self.blocked_until = max(self.blocked_until, now + reset)
+                return
+            self.bucket._refill(now)
+            self.bucket.rate = min(self.max_rate, remaining / max(reset, MIN_RESET_WINDOW))
+
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str) -> Optional[AdaptiveLimiter]:
+    """Get the shared limiter for a host, or None if it is not paced.
+
+    Subdomains share their parent's limiter (www/old.reddit.com).
+    """
+    for suffix, (rate, burst, max_rate) in HOST_LIMITS.items():
+        if host == suffix or host.endswith("." + suffix):
+            with _limiters_lock:
+                if suffix not in _limiters:
+                    _limiters[suffix] = AdaptiveLimiter(rate, burst, max_rate)
+                return _limiters[suffix]
+    return None
+
+
+def reserve_host(host: str) -> float:
+    """Reserve a request slot for a host (for callers that sleep themselves).
+
+    Returns:
+        Seconds to wait before sending
+    """
+    limiter = get_host_limiter(host)
+    return limiter.reserve() if limiter else 0.0
+
+
+def wait_for_host(host: str):
+    """Block until a request to host may be sent."""
+    limiter = get_host_limiter(host)
+    if limiter:
+        limiter.acquire()
+
+
+def parse_quota_headers(headers: Optional[Dict[str, str]]) -> Optional[Tuple[float, float]]:
+    """Read Reddit-style x-ratelimit-remaining/x-ratelimit-reset headers.
+
+    Returns:
+        Tuple of (remaining requests, seconds until reset), or None
+    """
+    if not headers:
+        return None
+    lowered = {k.lower(): v for k, v in headers.items()}
+    try:
+        return float(lowered["x-ratelimit-remaining"]), float(lowered["x-ratelimit-reset"])
+    except (KeyError, ValueError):
+        return None
+
+
+def observe_response(host: str, headers: Optional[Dict[str, str]]):
+    """Feed a response's rate-limit headers to the host's limiter."""
+    limiter = get_host_limiter(host)
+    quota = parse_quota_headers(headers)
+    if limiter and quota:
+        limiter.update(*quota)
@@ -1,10 +1,27 @@
 """Reddit thread enrichment with real engagement metrics."""
 
 import re
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 from urllib.parse import urlparse
 
-from . import http, dates
+from . import cache, http, dates, schema, timing
+
+# Concurrent enrichment settings
+ENRICH_WORKERS = 6
+REDDIT_HOST = "www.reddit.com"
+INFO_BATCH_SIZE = 100  # Max fullnames per /api/info request
+INFO_HEADERS = {
+    "User-Agent": http.USER_AGENT,
+    "Accept": "application/json",
+}
+COMMENT_TOP_K = 20  # Items whose comment trees are fetched (the compact report shows 20)
+REVALIDATE_WORKERS = 2  # Background refreshes of stale cached threads
+
+_revalidator = ThreadPoolExecutor(max_workers=REVALIDATE_WORKERS, thread_name_prefix="revalidate")
+_revalidating: set = set()
+_revalidate_lock = threading.Lock()
 
 
 def extract_reddit_path(url: str) -> Optional[str]:
@@ -25,12 +42,73 @@ def extract_reddit_path(url: str) -> Optional[str]:
         return None
 
 
-def fetch_thread_data(url: str, mock_data: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
+def thread_cache_key(url: str) -> Optional[str]:
+    """Build a cache key from a Reddit thread URL.
+
+    Uses the post ID from /comments/<id>/ so www/old/no-www hosts,
+    slugs, trailing slashes and query strings all share one entry.
+
+    Returns:
+        Cache key or None if the URL is not a Reddit thread
+    """
+    path = extract_reddit_path(url)
+    if not path:
+        return None
+    match = re.search(r'/comments/([a-z0-9]+)', path.lower())
+    if match:
+        return f"t3_{match.group(1)}"
+    return None
+
+
+def _download_thread(path: str, key: Optional[str]) -> Optional[Any]:
+    """Fetch thread JSON from Reddit and store it in the thread cache."""
+    try:
+        data = http.get_reddit_json(path)
+    except http.HTTPError:
+        return None
+    if key and data:
+        cache.save_thread_cache(key, data)
+    return data
+
+
+def revalidate_thread(path: str, key: str) -> None:
+    """Refresh a cached thread in the background.
+
+    At most one refresh per thread is in flight; callers keep serving
+    the stale copy until the new one lands in the cache.
+    """
+    with _revalidate_lock:
+        if key in _revalidating:
+            return
+        _revalidating.add(key)
+
+    def _refresh():
+        try:
+            _download_thread(path, key)
+        finally:
+            with _revalidate_lock:
+                _revalidating.discard(key)
+
+    _revalidator.submit(_refresh)
+
+
+def fetch_thread_data(
+    url: str,
+    mock_data: Optional[Dict] = None,
+    use_cache: bool = True,
+) -> Optional[Dict[str, Any]]:
     """Fetch Reddit thread JSON data.
 
+    Cached threads younger than THREAD_ENGAGEMENT_TTL_HOURS are served
+    directly. Entries younger than THREAD_STALE_TTL_HOURS are served
+    stale while a background refresh updates the cache. Older entries
+    are refetched, and if that fails the cached copy is still used for
+    its immutable fields.
+
     Args:
         url: Reddit thread URL
         mock_data: Mock data for testing
+        use_cache: If False, always fetch (the result is still cached)
 
     Returns:
         Thread data dict or None on failure
@@ -42,11 +120,22 @@ def fetch_thread_data(url: str, mock_data: Optional[Dict] = None) -> Optional[Di
     if not path:
         return None
 
-    try:
-        data = http.get_reddit_json(path)
-        return data
-    except http.HTTPError:
-        return None
+    key = thread_cache_key(url)
+    cached, age_hours = (None, None)
+    if key and use_cache:
+        cached, age_hours = cache.load_thread_cache(key)
+
+    if cached is not None:
+        if age_hours < cache.THREAD_ENGAGEMENT_TTL_HOURS:
+            return cached
+        if age_hours < cache.THREAD_STALE_TTL_HOURS:
+            revalidate_thread(path, key)
+            return cached
+
+    data = _download_thread(path, key)
+    if data is None:
+        return cached
+    return data
 
 
 def parse_thread_data(data: Any) -> Dict[str, Any]:
@@ -71,16 +160,7 @@ def parse_thread_data(data: Any) -> Dict[str, Any]:
     if isinstance(submission_listing, dict):
         children = submission_listing.get("data", {}).get("children", [])
         if children:
-            sub_data = children[0].get("data", {})
-            result["submission"] = {
-                "score": sub_data.get("score"),
-                "num_comments": sub_data.get("num_comments"),
-                "upvote_ratio": sub_data.get("upvote_ratio"),
-                "created_utc": sub_data.get("created_utc"),
-                "permalink": sub_data.get("permalink"),
-                "title": sub_data.get("title"),
-                "selftext": sub_data.get("selftext", "")[:500],  # Truncate
-            }
+            result["submission"] = _parse_submission(children[0].get("data", {}))
 
     # Second element is comments listing
     if len(data) >= 2:
@@ -175,15 +255,91 @@ def extract_comment_insights(comments: List[Dict], limit: int = 7) -> List[str]:
     return insights
 
 
+def _parse_submission(sub_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the submission fields used for enrichment."""
+    return {
+        "score": sub_data.get("score"),
+        "num_comments": sub_data.get("num_comments"),
+        "upvote_ratio": sub_data.get("upvote_ratio"),
+        "created_utc": sub_data.get("created_utc"),
+        "permalink": sub_data.get("permalink"),
+        "title": sub_data.get("title"),
+        "selftext": sub_data.get("selftext", "")[:500],  # Truncate
+    }
+
+
+def apply_submission(item: Dict[str, Any], submission: Dict[str, Any]):
+    """Set engagement metrics and date on an item from submission data."""
+    item["engagement"] = {
+        "score": submission.get("score"),
+        "num_comments": submission.get("num_comments"),
+        "upvote_ratio": submission.get("upvote_ratio"),
+    }
+
+    # Update date from actual data
+    created_utc = submission.get("created_utc")
+    if created_utc:
+        item["date"] = dates.timestamp_to_date(created_utc)
+
+
+def fetch_submissions_info(
+    fullnames: List[str],
+) -> Dict[str, Dict[str, Any]]:
+    """Fetch submission engagement in bulk via /api/info.
+
+    Reddit returns up to INFO_BATCH_SIZE submissions per request, so
+    engagement for a whole run costs one or two requests instead of one
+    full thread download each.
+
+    Args:
+        fullnames: Submission fullnames (t3_<id>)
+
+    Returns:
+        Dict of fullname -> submission dict (missing IDs are omitted)
+    """
+    result = {}
+    for url in info_urls(fullnames):
+        try:
+            data = http.get(url, headers=INFO_HEADERS)
+        except http.HTTPError:
+            continue
+        result.update(parse_info(data))
+    return result
+
+
+def info_urls(fullnames: List[str]) -> List[str]:
+    """/api/info URLs covering fullnames, INFO_BATCH_SIZE per request."""
+    unique = list(dict.fromkeys(fullnames))
+    return [
+        f"https://{REDDIT_HOST}/api/info.json?id={','.join(unique[start:start + INFO_BATCH_SIZE])}&raw_json=1"
+        for start in range(0, len(unique), INFO_BATCH_SIZE)
+    ]
+
+
+def parse_info(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Parse an /api/info listing into fullname -> submission dict."""
+    result = {}
+    for child in data.get("data", {}).get("children", []):
+        if child.get("kind") != "t3":
+            continue
+        sub_data = child.get("data", {})
+        name = sub_data.get("name")
+        if name:
+            result[name] = _parse_submission(sub_data)
+    return result
+
+
 def enrich_reddit_item(
     item: Dict[str, Any],
     mock_thread_data: Optional[Dict] = None,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """Enrich a Reddit item with real engagement data.
 
     Args:
         item: Reddit item dict
         mock_thread_data: Mock data for testing
+        use_cache: If False, bypass the on-disk thread cache
 
     Returns:
         Enriched item dict
@@ -191,7 +347,7 @@ def enrich_reddit_item(
     url = item.get("url", "")
 
     # Fetch thread data
-    thread_data = fetch_thread_data(url, mock_thread_data)
+    thread_data = fetch_thread_data(url, mock_thread_data, use_cache)
     if not thread_data:
         return item
 
@@ -201,32 +357,210 @@ def enrich_reddit_item(
 
     # Update engagement metrics
     if submission:
-        item["engagement"] = {
-            "score": submission.get("score"),
-            "num_comments": submission.get("num_comments"),
-            "upvote_ratio": submission.get("upvote_ratio"),
-        }
-
-        # Update date from actual data
-        created_utc = submission.get("created_utc")
-        if created_utc:
-            item["date"] = dates.timestamp_to_date(created_utc)
+        apply_submission(item, submission)
 
     # Get top comments
     top_comments = get_top_comments(comments)
-    item["top_comments"] = []
-    for c in top_comments:
+    item["top_comments"] = format_comments(top_comments)
+
+    # Extract insights
+    item["comment_insights"] = extract_comment_insights(top_comments)
+
+    return item
+
+
+def format_comments(comments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert parsed comments to report comment dicts (see schema.Comment)."""
+    formatted = []
+    for c in comments:
         permalink = c.get("permalink", "")
-        comment_url = f"https://reddit.com{permalink}" if permalink else ""
-        item["top_comments"].append({
+        formatted.append({
             "score": c.get("score", 0),
             "date": dates.timestamp_to_date(c.get("created_utc")),
             "author": c.get("author", ""),
             "excerpt": c.get("body", "")[:200],
-            "url": comment_url,
+            "url": f"https://reddit.com{permalink}" if permalink else "",
         })
+    return formatted
+
+
+class EnrichPlan(NamedTuple):
+    """How each item (by index) gets enriched; see plan_enrichment."""
+    cached_threads: Dict[int, Any]   # Thread JSON from the cache (comments, fallback engagement)
+    engagement_keys: Dict[int, str]  # Fullnames refreshed in bulk via /api/info
+    downloads: List[int]             # Items needing a full thread download
 
-    # Extract insights
-    item["comment_insights"] = extract_comment_insights(top_comments)
 
+def plan_enrichment(
+    items: List[Dict[str, Any]],
+    mock_thread_data: Optional[Dict] = None,
+    use_cache: bool = True,
+    comments: bool = True,
+) -> EnrichPlan:
+    """Decide which items can skip the full thread download.
+
+    - Cached thread younger than THREAD_ENGAGEMENT_TTL_HOURS: served from
+      the cache.
+    - Cached thread up to THREAD_STALE_TTL_HOURS old (any age if comments
+      is False): comments from the cache, engagement from /api/info.
+    - No usable cache: full download if comments is True, otherwise
+      engagement from /api/info only.
+
+    Shared by the threaded and asyncio enrichment paths.
+    """
+    plan = EnrichPlan({}, {}, [])
+    for index, item in enumerate(items):
+        if mock_thread_data is not None:
+            plan.downloads.append(index)
+            continue
+        key = thread_cache_key(item.get("url", ""))
+        data, age_hours = (None, None)
+        if key and use_cache:
+            data, age_hours = cache.load_thread_cache(key)
+        if data is not None and age_hours < cache.THREAD_ENGAGEMENT_TTL_HOURS:
+            plan.cached_threads[index] = data
+        elif key and (not comments or (data is not None and age_hours < cache.THREAD_STALE_TTL_HOURS)):
+            plan.engagement_keys[index] = key
+            if data is not None:
+                plan.cached_threads[index] = data
+        elif comments:
+            plan.downloads.append(index)
+    return plan
+
+
+def apply_plan(
+    item: Dict[str, Any],
+    index: int,
+    plan: EnrichPlan,
+    submissions: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Enrich an item from its cached thread and bulk engagement, if planned."""
+    if index in plan.cached_threads:
+        item = enrich_reddit_item(item, plan.cached_threads[index])
+    submission = submissions.get(plan.engagement_keys.get(index, ""))
+    if submission:
+        apply_submission(item, submission)
     return item
+
+
+def enrich_reddit_items(
+    items: List[Dict[str, Any]],
+    mock_thread_data: Optional[Dict] = None,
+    max_workers: int = ENRICH_WORKERS,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    error_callback: Optional[Callable[[Dict[str, Any], Exception], None]] = None,
+    use_cache: bool = True,
+    comments: bool = True,
+) -> List[Dict[str, Any]]:
+    """Enrich Reddit items concurrently with a bounded worker pool.
+
+    Engagement is refreshed in bulk via /api/info wherever the thread
+    body doesn't have to be downloaded (see plan_enrichment). With
+    comments False nothing is downloaded in full; the pipeline then
+    fetches comment trees only for the items it reports (fetch_comments).
+    Downloads are paced by the shared reddit.com limiter in http.request.
+
+    Results keep the input order. A failing item is passed to
+    error_callback and returned unchanged so one bad thread never
+    aborts the batch.
+
+    Args:
+        items: Reddit item dicts
+        mock_thread_data: Mock data for testing
+        max_workers: Maximum concurrent fetches
+        progress_callback: Optional callback(completed, total)
+        error_callback: Optional callback(item, exception) on failure
+        use_cache: If False, bypass the on-disk thread cache
+        comments: If False, only refresh engagement (no thread downloads)
+
+    Returns:
+        Enriched items in input order
+    """
+    total = len(items)
+    if not total:
+        return []
+
+    plan = plan_enrichment(items, mock_thread_data, use_cache, comments)
+    submissions = fetch_submissions_info(list(plan.engagement_keys.values())) if plan.engagement_keys else {}
+    downloads = set(plan.downloads)
+
+    results: List[Dict[str, Any]] = list(items)
+    completed = 0
+    counter_lock = threading.Lock()
+
+    def _work(index: int):
+        nonlocal completed
+        item = items[index]
+        try:
+            if index in downloads:
+                results[index] = enrich_reddit_item(item, mock_thread_data, use_cache)
+            else:
+                results[index] = apply_plan(item, index, plan, submissions)
+        except Exception as e:
+            if error_callback:
+                error_callback(item, e)
+        with counter_lock:
+            completed += 1
+            done = completed
+        if progress_callback:
+            progress_callback(done, total)
+
+    workers = max(1, min(max_workers, total))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(timing.bind(_work), range(total)))
+
+    return results
+
+
+def comment_targets(items: List[schema.SaaSIdeaItem], limit: int = COMMENT_TOP_K) -> List[schema.SaaSIdeaItem]:
+    """Reddit items among the first limit that still have no comments."""
+    return [item for item in items[:limit] if item.source == "reddit" and not item.top_comments]
+
+
+def apply_comments(item: schema.SaaSIdeaItem, thread_data: Any):
+    """Set top comments and insights on a scored item from thread JSON."""
+    top_comments = get_top_comments(parse_thread_data(thread_data).get("comments", []))
+    item.top_comments = [schema.Comment.from_dict(c) for c in format_comments(top_comments)]
+    item.comment_insights = extract_comment_insights(top_comments)
+
+
+def fetch_comments(
+    items: List[schema.SaaSIdeaItem],
+    limit: int = COMMENT_TOP_K,
+    max_workers: int = ENRICH_WORKERS,
+    error_callback: Optional[Callable[[Any, Exception], None]] = None,
+    use_cache: bool = True,
+) -> int:
+    """Fetch comment trees for the top-ranked Reddit items only.
+
+    Runs after scoring, so a cold run downloads at most limit threads
+    instead of one per search result.
+
+    Args:
+        items: Scored items, best first
+        limit: Only the first limit items are considered
+        max_workers: Maximum concurrent fetches
+        error_callback: Optional callback(item, exception) on failure
+        use_cache: If False, bypass the on-disk thread cache
+
+    Returns:
+        Number of items given comments
+    """
+    targets = comment_targets(items, limit)
+    if not targets:
+        return 0
+
+    def _work(item: schema.SaaSIdeaItem) -> bool:
+        try:
+            thread_data = fetch_thread_data(item.url, use_cache=use_cache)
+            if not thread_data:
+                return False
+            apply_comments(item, thread_data)
+            return True
+        except Exception as e:
+            if error_callback:
+                error_callback(item, e)
+            return False
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as executor:
+        return sum(executor.map(timing.bind(_work), targets))
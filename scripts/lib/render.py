@@ -1,6 +1,8 @@
 """Output rendering for saas-radar skill."""
 
+import hashlib
 import json
+import re
 from pathlib import Path
 from typing import List, Optional
 
@@ -14,6 +16,16 @@ def ensure_output_dir():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def topic_slug(topic: str) -> str:
+    """Turn a topic into a filesystem-safe directory name.
+
+    A short hash of the raw topic keeps topics that normalize alike
+    ("CRM!" and "crm") from sharing a directory.
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", topic.lower()).strip("-")[:60] or "topic"
+    return f"{slug}-{hashlib.sha1(topic.encode('utf-8')).hexdigest()[:8]}"
+
+
 def _format_count(n: int) -> str:
     """Format a count with K/M suffix."""
     if n >= 1_000_000:
@@ -46,6 +58,8 @@ def render_compact(report: schema.SaaSReport, limit: int = 20, missing_keys: str
         lines.append(f"**OpenAI Model:** {report.openai_model_used}")
     if report.xai_model_used:
         lines.append(f"**xAI Model:** {report.xai_model_used}")
+    if report.from_cache and report.cache_age_hours is not None:
+        lines.append(f"**Cached:** {report.cache_age_hours:.1f}h old (generated {report.generated_at})")
     lines.append("")
 
     # Coverage tips
@@ -61,8 +75,9 @@ def render_compact(report: schema.SaaSReport, limit: int = 20, missing_keys: str
         lines.append("### Growing Subreddits")
         lines.append("")
         for i, g in enumerate(report.growth_signals):
+            window = f" over {g.window_days}d" if g.window_days < 180 else ""
             lines.append(
-                f"{i+1}. r/{g.subreddit} ({g.acceleration:.1f}x acceleration, "
+                f"{i+1}. r/{g.subreddit} ({g.acceleration:.1f}x acceleration{window}, "
                 f"{_format_count(g.subscribers)} subs, {_format_count(g.active_users)} active)"
             )
         lines.append("")
@@ -150,6 +165,15 @@ def render_compact(report: schema.SaaSReport, limit: int = 20, missing_keys: str
 
             lines.append("")
 
+    # Timing (--profile)
+    if report.timing:
+        lines.append("### Timing")
+        lines.append("")
+        lines.append("```json")
+        lines.append(json.dumps(report.timing, indent=2))
+        lines.append("```")
+        lines.append("")
+
     return "\n".join(lines)
 
 
@@ -158,6 +182,7 @@ def write_outputs(
     raw_openai: Optional[dict] = None,
     raw_xai: Optional[dict] = None,
     raw_reddit_enriched: Optional[list] = None,
+    out_dir: Optional[Path] = None,
 ):
     """Write all output files.
 
@@ -166,22 +191,39 @@ def write_outputs(
         raw_openai: Raw OpenAI API response
         raw_xai: Raw xAI API response
         raw_reddit_enriched: Raw enriched Reddit thread data
+        out_dir: Directory to write to (default: OUTPUT_DIR)
     """
-    ensure_output_dir()
+    out_dir = out_dir or OUTPUT_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
 
     # report.json
-    with open(OUTPUT_DIR / "report.json", 'w') as f:
+    with open(out_dir / "report.json", 'w') as f:
         json.dump(report.to_dict(), f, indent=2)
 
     # Raw responses
     if raw_openai:
-        with open(OUTPUT_DIR / "raw_openai.json", 'w') as f:
+        with open(out_dir / "raw_openai.json", 'w') as f:
             json.dump(raw_openai, f, indent=2)
 
     if raw_xai:
-        with open(OUTPUT_DIR / "raw_xai.json", 'w') as f:
+        with open(out_dir / "raw_xai.json", 'w') as f:
             json.dump(raw_xai, f, indent=2)
 
     if raw_reddit_enriched:
-        with open(OUTPUT_DIR / "raw_reddit_threads_enriched.json", 'w') as f:
+        with open(out_dir / "raw_reddit_threads_enriched.json", 'w') as f:
             json.dump(raw_reddit_enriched, f, indent=2)
+
+
+def write_profile(profiler) -> Path:
+    """Dump cProfile stats to the output directory.
+
+    Args:
+        profiler: pstats.Stats or disabled cProfile.Profile
+
+    Returns:
+        Path to the written .pstats file
+    """
+    ensure_output_dir()
+    path = OUTPUT_DIR / "profile.pstats"
+    profiler.dump_stats(str(path))
+    return path
@@ -0,0 +1,89 @@
+"""Dependency-aware phase scheduler for saas-radar skill."""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable
+
+from . import timing
+
+
+class PhaseScheduler:
+    """Run pipeline phases as soon as the phases they depend on finish.
+
+    Each phase is submitted to a thread pool once every phase named in
+    `after` has completed, so independent phases overlap. If a
+    dependency fails, dependents fail with the same exception without
+    running.
+
+    Usage:
+        with PhaseScheduler() as sched:
+            sched.add("growth", scan)
+            sched.add("reddit", lambda: search(sched.result("growth")), after=["growth"])
+            items = sched.result("reddit")
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.futures: Dict[str, Future] = {}
+
+    def __enter__(self) -> "PhaseScheduler":
+        return self
+
+    def __exit__(self, *exc):
+        # Dependents are submitted from callbacks, so let every phase
+        # settle before the pool stops accepting work
+        wait(list(self.futures.values()))
+        self.executor.shutdown(wait=True)
+
+    def add(self, name: str, fn: Callable[..., Any], *args, after: Iterable[str] = (), **kwargs) -> Future:
+        """Schedule a phase to run once its dependencies complete.
+
+        Args:
+            name: Unique phase name
+            fn: Callable to run
+            *args, **kwargs: Passed to fn
+            after: Names of phases that must finish first
+
+        Returns:
+            Future for the phase result
+        """
+        deps = [self.futures[d] for d in after]
+        # Dependents start from other threads' callbacks; bind to the caller's timing
+        bound = timing.bind(fn)
+        outer: Future = Future()
+        self.futures[name] = outer
+
+        pending = [len(deps)]
+        pending_lock = threading.Lock()
+
+        def _start():
+            for dep in deps:
+                if dep.exception() is not None:
+                    outer.set_exception(dep.exception())
+                    return
+            inner = self.executor.submit(bound, *args, **kwargs)
+            inner.add_done_callback(_chain)
+
+        def _chain(inner: Future):
+            if inner.exception() is not None:
+                outer.set_exception(inner.exception())
+            else:
+                outer.set_result(inner.result())
+
+        def _dep_done(_):
+            with pending_lock:
+                pending[0] -= 1
+                ready = pending[0] == 0
+            if ready:
+                _start()
+
+        if not deps:
+            _start()
+        for dep in deps:
+            dep.add_done_callback(_dep_done)
+
+        return outer
+
+    def result(self, name: str) -> Any:
+        """Wait for a phase and return its result (re-raises failures)."""
+        return self.futures[name].result()
@@ -37,6 +37,18 @@ class Engagement:
             d['quotes'] = self.quotes
         return d if d else None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Engagement":
+        return cls(
+            score=data.get('score'),
+            num_comments=data.get('num_comments'),
+            upvote_ratio=data.get('upvote_ratio'),
+            likes=data.get('likes'),
+            reposts=data.get('reposts'),
+            replies=data.get('replies'),
+            quotes=data.get('quotes'),
+        )
+
 
 @dataclass
 class Comment:
@@ -56,6 +68,16 @@ class Comment:
             'url': self.url,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Comment":
+        return cls(
+            score=data.get('score', 0),
+            date=data.get('date'),
+            author=data.get('author', ''),
+            excerpt=data.get('excerpt', ''),
+            url=data.get('url', ''),
+        )
+
 
 @dataclass
 class SubScores:
@@ -75,6 +97,16 @@ class SubScores:
             'recency': self.recency,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SubScores":
+        return cls(
+            idea_quality=data.get('idea_quality', 0),
+            engagement=data.get('engagement', 0),
+            market_signal=data.get('market_signal', 0),
+            growth=data.get('growth', 0),
+            recency=data.get('recency', 0),
+        )
+
 
 @dataclass
 class GrowthSignal:
@@ -87,6 +119,7 @@ class GrowthSignal:
     engagement_accel: float   # avg score recent/avg score older
     recent_count: int
     older_count: int
+    window_days: int = 180    # span compared (shorter while history is short)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -98,6 +131,7 @@ class GrowthSignal:
             'engagement_accel': round(self.engagement_accel, 2),
             'recent_count': self.recent_count,
             'older_count': self.older_count,
+            'window_days': self.window_days,
         }
 
     @classmethod
@@ -111,6 +145,7 @@ class GrowthSignal:
             engagement_accel=data.get('engagement_accel', 1.0),
             recent_count=data.get('recent_count', 0),
             older_count=data.get('older_count', 0),
+            window_days=data.get('window_days', 180),
         )
 
 
@@ -164,6 +199,33 @@ class SaaSIdeaItem:
             'score': self.score,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SaaSIdeaItem":
+        engagement = data.get('engagement')
+        return cls(
+            id=data.get('id', ''),
+            title=data.get('title', ''),
+            url=data.get('url', ''),
+            source=data.get('source', ''),
+            subreddit=data.get('subreddit', ''),
+            author_handle=data.get('author_handle', ''),
+            date=data.get('date'),
+            date_confidence=data.get('date_confidence', 'low'),
+            signal_type=data.get('signal_type', 'problem'),
+            idea_summary=data.get('idea_summary', ''),
+            target_audience=data.get('target_audience', ''),
+            subreddit_growth=data.get('subreddit_growth', 1.0),
+            market_signal=data.get('market_signal', 25),
+            cluster_id=data.get('cluster_id', -1),
+            engagement=Engagement.from_dict(engagement) if engagement else None,
+            top_comments=[Comment.from_dict(c) for c in data.get('top_comments', [])],
+            comment_insights=data.get('comment_insights', []),
+            relevance=data.get('relevance', 0.5),
+            why_relevant=data.get('why_relevant', ''),
+            subs=SubScores.from_dict(data.get('subs', {})),
+            score=data.get('score', 0),
+        )
+
 
 @dataclass
 class SaaSReport:
@@ -181,6 +243,7 @@ class SaaSReport:
     x_error: Optional[str] = None
     from_cache: bool = False
     cache_age_hours: Optional[float] = None
+    timing: Optional[Dict[str, Any]] = None
 
     def to_dict(self) -> Dict[str, Any]:
         d = {
@@ -204,8 +267,29 @@ class SaaSReport:
             d['from_cache'] = self.from_cache
         if self.cache_age_hours is not None:
             d['cache_age_hours'] = self.cache_age_hours
+        if self.timing is not None:
+            d['timing'] = self.timing
         return d
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SaaSReport":
+        date_range = data.get('range', {})
+        return cls(
+            topic=data['topic'],
+            range_from=date_range.get('from', ''),
+            range_to=date_range.get('to', ''),
+            generated_at=data.get('generated_at', ''),
+            mode=data.get('mode', ''),
+            openai_model_used=data.get('openai_model_used'),
+            xai_model_used=data.get('xai_model_used'),
+            growth_signals=[GrowthSignal.from_dict(g) for g in data.get('growth_signals', [])],
+            items=[SaaSIdeaItem.from_dict(i) for i in data.get('items', [])],
+            reddit_error=data.get('reddit_error'),
+            x_error=data.get('x_error'),
+            from_cache=data.get('from_cache', False),
+            cache_age_hours=data.get('cache_age_hours'),
+        )
+
 
 def create_saas_report(
     topic: str,
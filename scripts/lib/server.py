@@ -0,0 +1,282 @@
+"""Local HTTP/JSON daemon for saas-radar skill (stdlib only).
+
+Keeps one warm process so setup, model selection, growth signals and
+the report/thread caches survive between queries. Endpoints:
+
+    GET  /health             Daemon status
+    POST /jobs               Submit {"topic": ..., "depth"?, "refresh"?, "wait"?}
+    GET  /jobs               List jobs (most recent first, without reports)
+    GET  /jobs/<id>          Job status, plus the report once done
+    GET  /jobs/<id>/events   Stream status events as NDJSON until done
+"""
+
+import json
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+SERVE_WORKERS = 4  # Topics researched concurrently
+MAX_JOBS = 500  # Finished jobs kept for polling
+MAX_BODY_BYTES = 64 * 1024
+DEPTHS = ("quick", "default", "deep")
+
+
+def _log(msg: str):
+    """Log to stderr."""
+    sys.stderr.write(f"[SERVE] {msg}\n")
+    sys.stderr.flush()
+
+
+class Job:
+    """One submitted topic and its status events."""
+
+    def __init__(self, topic: str, options: Dict[str, Any]):
+        self.id = uuid.uuid4().hex[:12]
+        self.topic = topic
+        self.options = options
+        self.status = "queued"
+        self.report: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.submitted = time.time()
+        self.finished: Optional[float] = None
+        self.events: List[Dict[str, Any]] = []
+        self.cond = threading.Condition()
+        self._emit("queued")
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("done", "error")
+
+    def _emit(self, status: str, **extra):
+        with self.cond:
+            self.status = status
+            self.events.append({"status": status, "time": round(time.time(), 3), **extra})
+            self.cond.notify_all()
+
+    def start(self):
+        self._emit("running")
+
+    def finish(self, report: Dict[str, Any]):
+        self.report = report
+        self.finished = time.time()
+        self._emit("done", items=len(report.get("items", [])))
+
+    def fail(self, error: str):
+        self.error = error
+        self.finished = time.time()
+        self._emit("error", error=error)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job is done or timeout elapses."""
+        with self.cond:
+            return self.cond.wait_for(lambda: self.done, timeout)
+
+    def to_dict(self, include_report: bool = True) -> Dict[str, Any]:
+        d = {
+            "id": self.id,
+            "topic": self.topic,
+            "options": self.options,
+            "status": self.status,
+            "submitted": round(self.submitted, 3),
+        }
+        if self.finished is not None:
+            d["finished"] = round(self.finished, 3)
+            d["duration"] = round(self.finished - self.submitted, 3)
+        if self.error:
+            d["error"] = self.error
+        if include_report and self.report is not None:
+            d["report"] = self.report
+        return d
+
+
+class JobManager:
+    """Runs jobs on a worker pool and keeps a bounded job history."""
+
+    def __init__(
+        self,
+        runner: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+        max_workers: int = SERVE_WORKERS,
+    ):
+        self.runner = runner
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.started = time.time()
+
+    def submit(self, topic: str, options: Dict[str, Any]) -> Job:
+        job = Job(topic, options)
+        with self.lock:
+            self.jobs[job.id] = job
+            self._evict()
+        self.executor.submit(self._execute, job)
+        return job
+
+    def _evict(self):
+        """Drop the oldest finished jobs beyond MAX_JOBS (lock held)."""
+        excess = len(self.jobs) - MAX_JOBS
+        if excess <= 0:
+            return
+        for job_id in [j.id for j in self.jobs.values() if j.done][:excess]:
+            del self.jobs[job_id]
+
+    def _execute(self, job: Job):
+        job.start()
+        try:
+            job.finish(self.runner(job.topic, job.options))
+        except BaseException as e:  # SystemExit from pipeline code must not kill the worker
+            _log(f"Job {job.id} ({job.topic}) failed: {type(e).__name__}: {e}")
+            job.fail(f"{type(e).__name__}: {e}")
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self.lock:
+            return list(reversed(self.jobs.values()))
+
+    def stats(self) -> Dict[str, Any]:
+        jobs = self.list()
+        return {
+            "status": "ok",
+            "uptime": round(time.time() - self.started, 1),
+            "jobs": len(jobs),
+            "active": sum(1 for j in jobs if not j.done),
+        }
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _make_handler(manager: JobManager):
+    """Build a request handler class bound to a JobManager."""
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "saas-radar"
+
+        def log_message(self, format: str, *args):
+            _log(f"{self.address_string()} {format % args}")
+
+        def _send_json(self, status: int, data: Any):
+            body = json.dumps(data).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _read_json(self) -> Optional[Dict[str, Any]]:
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                return None
+            if length < 0 or length > MAX_BODY_BYTES:
+                return None
+            try:
+                data = json.loads(self.rfile.read(length) or b"{}")
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                return None
+            return data if isinstance(data, dict) else None
+
+        def do_GET(self):
+            parts = [p for p in self.path.split("?")[0].split("/") if p]
+            if parts == ["health"]:
+                self._send_json(200, manager.stats())
+            elif parts == ["jobs"]:
+                self._send_json(200, [j.to_dict(include_report=False) for j in manager.list()])
+            elif len(parts) in (2, 3) and parts[0] == "jobs":
+                job = manager.get(parts[1])
+                if job is None:
+                    self._send_json(404, {"error": "unknown job"})
+                elif len(parts) == 2:
+                    self._send_json(200, job.to_dict())
+                elif parts[2] == "events":
+                    self._stream_events(job)
+                else:
+                    self._send_json(404, {"error": "not found"})
+            else:
+                self._send_json(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path.split("?")[0].rstrip("/") != "/jobs":
+                self._send_json(404, {"error": "not found"})
+                return
+            data = self._read_json()
+            if data is None:
+                self._send_json(400, {"error": "body must be a JSON object"})
+                return
+            topic = str(data.get("topic") or "").strip()
+            if not topic:
+                self._send_json(400, {"error": "topic is required"})
+                return
+            depth = data.get("depth")
+            if depth is not None and depth not in DEPTHS:
+                self._send_json(400, {"error": f"depth must be one of {', '.join(DEPTHS)}"})
+                return
+
+            job = manager.submit(topic, {"depth": depth, "refresh": bool(data.get("refresh"))})
+            if data.get("wait"):
+                job.wait()
+                self._send_json(200, job.to_dict())
+            else:
+                self._send_json(202, job.to_dict())
+
+        def _stream_events(self, job: Job):
+            """Write one JSON event per line as the job progresses."""
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            sent = 0
+            try:
+                while True:
+                    with job.cond:
+                        job.cond.wait_for(lambda: len(job.events) > sent or job.done)
+                        pending = job.events[sent:]
+                        finished = job.done
+                    for event in pending:
+                        self.wfile.write(json.dumps(event).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+                    sent += len(pending)
+                    if finished and sent >= len(job.events):
+                        break
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return Handler
+
+
+def serve(
+    runner: Callable[[str, Dict[str, Any]], Dict[str, Any]],
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    max_workers: int = SERVE_WORKERS,
+):
+    """Serve the query API until interrupted.
+
+    Args:
+        runner: Callable(topic, options) returning a report dict; called
+            on worker threads; options has 'depth' (None for the
+            daemon default) and 'refresh'
+        host: Interface to bind (local only by default)
+        port: TCP port
+        max_workers: Topics researched concurrently
+    """
+    manager = JobManager(runner, max_workers)
+    httpd = ThreadingHTTPServer((host, port), _make_handler(manager))
+    httpd.daemon_threads = True
+    _log(f"Listening on http://{host}:{httpd.server_address[1]}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        _log("Shutting down")
+    finally:
+        httpd.server_close()
+        manager.shutdown()
@@ -0,0 +1,236 @@
+"""Subreddit discovery for saas-radar skill.
+
+Grows the growth-scan subreddit list beyond SAAS_SUBREDDITS. Subreddits
+are mined from Reddit search results, sidebars (about.json) and
+related-community widgets, and accumulate in the growth store's
+discovered table, which doubles as the persistent seen-set and the
+crawl frontier. Each run crawls only a few frontier subreddits, so
+discovery is incremental; the ranked candidate list is cached.
+"""
+
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import cache, growth_store, http, subreddit_growth, timing
+
+MAX_CANDIDATES = 10  # Discovered subreddits added to the growth scan
+EXPAND_PER_RUN = 5  # Frontier subreddits crawled per discovery run
+REEXPAND_DAYS = 30  # Re-crawl a subreddit's links after this
+MIN_SUBSCRIBERS = 1000  # Smaller subreddits are not candidates
+MAX_TRACKED = 5000  # Seen-set size bound
+
+# Score added per mention, by where the subreddit was seen
+SEARCH_WEIGHT = 2.0
+RELATED_WEIGHT = 1.5
+SIDEBAR_WEIGHT = 1.0
+
+_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_]{1,20}$")
+_LINK_RE = re.compile(r"(?<![\w/])/?r/([A-Za-z0-9][A-Za-z0-9_]{1,20})\b")
+
+
+def _log(msg: str):
+    """Log to stderr."""
+    sys.stderr.write(f"[DISCOVER] {msg}\n")
+    sys.stderr.flush()
+
+
+def clean_name(name: Any) -> Optional[str]:
+    """Normalize 'r/Foo', '/r/Foo/' or 'Foo' to 'Foo'; None if not a valid name."""
+    name = str(name or "").strip().strip("/")
+    if name[:2].lower() == "r/":
+        name = name[2:]
+    return name if _NAME_RE.match(name) else None
+
+
+def mine_links(text: str) -> List[str]:
+    """Subreddit names linked as r/name in markdown or text."""
+    return _LINK_RE.findall(text or "")
+
+
+def parse_about(data: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+    """Parse about.json into subreddit info and sidebar links.
+
+    Returns:
+        Tuple of (info with name, status, subscribers and active_users;
+        sidebar-linked names). info is None if the response is not a
+        subreddit (Reddit answers unknown names with a search listing).
+    """
+    if data.get("kind") != "t5":
+        return None, []
+    about = data.get("data", {})
+    subscribers = about.get("subscribers") or 0
+    if about.get("over18"):
+        status = "nsfw"
+    elif about.get("subreddit_type") not in ("public", "restricted"):
+        status = "private"
+    elif subscribers < MIN_SUBSCRIBERS:
+        status = "small"
+    else:
+        status = "ok"
+    info = {
+        "name": about.get("display_name"),
+        "status": status,
+        "subscribers": subscribers,
+        "active_users": about.get("active_user_count") or about.get("accounts_active") or 0,
+    }
+    links = mine_links(about.get("description", "")) + mine_links(about.get("public_description", ""))
+    return info, links
+
+
+def parse_widgets(data: Dict[str, Any]) -> List[str]:
+    """Related-community names (and r/ links in text widgets) from widgets.json."""
+    names = []
+    for widget in (data.get("items") or {}).values():
+        kind = widget.get("kind")
+        if kind == "community-list":
+            names.extend(c.get("name", "") for c in widget.get("data", []))
+        elif kind == "textarea":
+            names.extend(mine_links(widget.get("text", "")))
+    return names
+
+
+def _count(names: Iterable[Any], exclude: str = "") -> Dict[str, int]:
+    """Count valid names, merging case variants under the first spelling seen."""
+    counts: Counter = Counter()
+    spelling: Dict[str, str] = {}
+    for raw in names:
+        name = clean_name(raw)
+        if not name or name.lower() == exclude.lower():
+            continue
+        counts[spelling.setdefault(name.lower(), name)] += 1
+    return dict(counts)
+
+
+def record_search_results(
+    items: List[Dict[str, Any]],
+    store: Optional[growth_store.GrowthStore] = None,
+) -> int:
+    """Add the subreddits of Reddit search results to the seen-set.
+
+    Returns:
+        Number of subreddits not seen before
+    """
+    mentions = _count(item.get("subreddit") for item in items)
+    if not mentions:
+        return 0
+    store = store or growth_store.get_store()
+    return store.record_discoveries(mentions, SEARCH_WEIGHT)
+
+
+def expand_subreddit(sub: str, store: growth_store.GrowthStore) -> int:
+    """Crawl one subreddit's about.json and widgets, recording what it links to.
+
+    Transient failures leave the subreddit in the frontier.
+
+    Returns:
+        Number of subreddits not seen before
+    """
+    try:
+        about_data = http.get(
+            f"https://www.reddit.com/r/{sub}/about.json",
+            headers=subreddit_growth.REDDIT_HEADERS, conditional=True,
+        )
+    except http.HTTPError as e:
+        if e.status_code in (403, 404):
+            store.mark_expanded(sub, "private" if e.status_code == 403 else "missing")
+        else:
+            _log(f"Failed to fetch about for r/{sub}: {e}")
+        return 0
+
+    info, sidebar = parse_about(about_data)
+    if info is None:
+        store.mark_expanded(sub, "missing")
+        return 0
+
+    related = []
+    if info["status"] not in ("nsfw", "private"):
+        try:
+            related = parse_widgets(http.get(
+                f"https://www.reddit.com/r/{sub}/api/widgets.json",
+                headers=subreddit_growth.REDDIT_HEADERS, conditional=True,
+            ))
+        except http.HTTPError as e:
+            _log(f"Failed to fetch widgets for r/{sub}: {e}")
+
+    store.mark_expanded(sub, **info)
+    if info["status"] in ("nsfw", "private"):
+        return 0
+    return (
+        store.record_discoveries(_count(related, exclude=sub), RELATED_WEIGHT)
+        + store.record_discoveries(_count(sidebar, exclude=sub), SIDEBAR_WEIGHT)
+    )
+
+
+def expand_frontier(store: growth_store.GrowthStore, limit: int = EXPAND_PER_RUN) -> int:
+    """Crawl up to limit frontier subreddits concurrently.
+
+    Returns:
+        Number of subreddits not seen before
+    """
+    frontier = store.discovery_frontier(limit, time.time() - REEXPAND_DAYS * 86400)
+    if not frontier:
+        return 0
+    with ThreadPoolExecutor(max_workers=subreddit_growth.GROWTH_WORKERS) as executor:
+        added = sum(executor.map(timing.bind(lambda sub: expand_subreddit(sub, store)), frontier))
+    _log(f"Crawled {len(frontier)} subreddits, found {added} new")
+    return added
+
+
+def discover_subreddits(
+    mock: bool = False,
+    limit: int = MAX_CANDIDATES,
+    store: Optional[growth_store.GrowthStore] = None,
+    max_age_hours: float = cache.DISCOVERY_CACHE_TTL_HOURS,
+    refresh: bool = False,
+) -> List[str]:
+    """Ranked discovered subreddits to add to the growth scan.
+
+    Reuses the cached candidate list while it is younger than
+    max_age_hours. Otherwise seeds the seen-set with SAAS_SUBREDDITS,
+    crawls part of the frontier, and ranks verified subreddits by
+    weighted mention score.
+
+    Args:
+        mock: If True, discover nothing
+        limit: Maximum candidates returned (excluding SAAS_SUBREDDITS)
+        store: Growth store holding the seen-set (default: growth_store.get_store())
+        max_age_hours: Reuse a cached candidate list younger than this
+        refresh: If True, ignore the cached candidate list
+
+    Returns:
+        Subreddit names, best first
+    """
+    if mock:
+        return []
+    if not refresh:
+        cached = cache.load_discovery_cache(max_age_hours)
+        if cached is not None:
+            return cached[:limit]
+
+    store = store or growth_store.get_store()
+    store.record_discoveries({sub: 0 for sub in subreddit_growth.SAAS_SUBREDDITS}, 0)
+    expand_frontier(store)
+    store.prune_discoveries(MAX_TRACKED)
+
+    seeds = {sub.lower() for sub in subreddit_growth.SAAS_SUBREDDITS}
+    candidates = [
+        c["name"] for c in store.discovery_candidates(limit + len(seeds))
+        if c["name"].lower() not in seeds
+    ][:limit]
+    cache.save_discovery_cache(candidates)
+    return candidates
+
+
+def growth_subreddits(discovered: List[str]) -> List[str]:
+    """SAAS_SUBREDDITS followed by discovered subreddits, without duplicates."""
+    subs = list(subreddit_growth.SAAS_SUBREDDITS)
+    seen = {sub.lower() for sub in subs}
+    for sub in discovered:
+        if sub.lower() not in seen:
+            seen.add(sub.lower())
+            subs.append(sub)
+    return subs
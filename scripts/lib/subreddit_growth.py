@@ -2,20 +2,40 @@
 
 import json
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from . import http, schema
+from . import cache, growth_store, http, schema, timing
 
 SAAS_SUBREDDITS = [
     "SaaS", "microsaas", "indiehackers", "startups", "Entrepreneur",
     "SideProject", "selfhosted", "nocode", "automation", "smallbusiness",
 ]
 
-# Rate limit delay between subreddit requests
-RATE_LIMIT_DELAY = 1.0
+# Concurrent growth scan settings (request pacing is done per host
+# by ratelimit's adaptive limiter inside http.request)
+GROWTH_WORKERS = 4
+
+# new.json crawl: pages of 100 walked with after= cursors. Reddit stops
+# listings at ~1000 posts, so busy subreddits can't be crawled back the
+# full 180 days in one go; the growth store fills in history over time.
+MAX_PAGES = 10
+GROWTH_DAYS = 180
+# Incremental crawls re-read this many days before the newest stored
+# post so scores captured minutes after posting get refreshed once
+# votes have mostly settled
+SCORE_REFRESH_DAYS = 3
+# Subreddits with less complete history than this get no signal
+MIN_HISTORY_DAYS = 14
+
+REDDIT_HEADERS = {
+    "User-Agent": http.USER_AGENT,
+    "Accept": "application/json",
+}
 
 
 def _log(msg: str):
@@ -24,6 +44,31 @@ def _log(msg: str):
     sys.stderr.flush()
 
 
+def parse_subreddit_about(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract subscribers and active users from about.json."""
+    about = data.get("data", {})
+    return {
+        "subscribers": about.get("subscribers", 0),
+        "active_users": about.get("active_user_count") or about.get("accounts_active") or 0,
+    }
+
+
+def parse_subreddit_posts(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract id (fullname), created_utc and score for each post in a listing."""
+    children = data.get("data", {}).get("children", [])
+    posts = []
+    for child in children:
+        post_data = child.get("data", {})
+        created = post_data.get("created_utc")
+        if created:
+            posts.append({
+                "id": post_data.get("name"),
+                "created_utc": created,
+                "score": post_data.get("score", 0),
+            })
+    return posts
+
+
 def fetch_subreddit_about(sub: str) -> Optional[Dict[str, Any]]:
     """Fetch subreddit metadata (subscribers, active users).
 
@@ -34,55 +79,211 @@ def fetch_subreddit_about(sub: str) -> Optional[Dict[str, Any]]:
         Dict with subscribers and active_user_count, or None on failure
     """
     url = f"https://www.reddit.com/r/{sub}/about.json"
-    headers = {
-        "User-Agent": http.USER_AGENT,
-        "Accept": "application/json",
-    }
 
     try:
-        data = http.get(url, headers=headers)
-        about = data.get("data", {})
-        return {
-            "subscribers": about.get("subscribers", 0),
-            "active_users": about.get("active_user_count") or about.get("accounts_active") or 0,
-        }
+        return parse_subreddit_about(http.get(url, headers=REDDIT_HEADERS, conditional=True))
     except http.HTTPError as e:
         _log(f"Failed to fetch about for r/{sub}: {e}")
         return None
 
 
-def fetch_subreddit_posts(sub: str, limit: int = 100) -> Optional[List[Dict[str, Any]]]:
-    """Fetch recent posts from a subreddit.
+def posts_url(sub: str, limit: int = 100, after: Optional[str] = None) -> str:
+    """Build the new.json listing URL for a subreddit."""
+    url = f"https://www.reddit.com/r/{sub}/new.json?limit={limit}&raw_json=1"
+    if after:
+        url += f"&after={after}"
+    return url
+
+
+def fetch_posts_page(sub: str, limit: int = 100, after: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Fetch one raw new.json listing page, or None on failure.
+
+    Only the first page is revalidated: cursor pages are one-off URLs.
+    """
+    try:
+        return http.get(
+            posts_url(sub, limit, after), headers=REDDIT_HEADERS, conditional=after is None,
+        )
+    except http.HTTPError as e:
+        _log(f"Failed to fetch posts for r/{sub}: {e}")
+        return None
+
+
+def fetch_subreddit_posts(
+    sub: str,
+    limit: int = 100,
+    after: Optional[str] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """Fetch one page of recent posts from a subreddit.
 
     Args:
         sub: Subreddit name (without r/)
         limit: Number of posts to fetch (max 100)
+        after: Listing cursor (fullname of the last post on the previous page)
 
     Returns:
-        List of post dicts with created_utc and score, or None on failure
+        List of post dicts with id, created_utc and score, or None on failure
     """
-    url = f"https://www.reddit.com/r/{sub}/new.json?limit={limit}&raw_json=1"
-    headers = {
-        "User-Agent": http.USER_AGENT,
-        "Accept": "application/json",
-    }
+    data = fetch_posts_page(sub, limit, after)
+    return parse_subreddit_posts(data) if data is not None else None
 
-    try:
-        data = http.get(url, headers=headers)
-        children = data.get("data", {}).get("children", [])
-        posts = []
-        for child in children:
-            post_data = child.get("data", {})
-            created = post_data.get("created_utc")
-            if created:
-                posts.append({
-                    "created_utc": created,
-                    "score": post_data.get("score", 0),
-                })
-        return posts
-    except http.HTTPError as e:
-        _log(f"Failed to fetch posts for r/{sub}: {e}")
+
+def listing_after(data: Dict[str, Any]) -> Optional[str]:
+    """Cursor for the next (older) listing page, or None at the end."""
+    return data.get("data", {}).get("after")
+
+
+def take_page(
+    posts: List[Dict[str, Any]],
+    cutoff: float,
+    stop_at: Optional[float] = None,
+) -> tuple:
+    """Keep a newest-first page's posts newer than cutoff and stop_at.
+
+    Returns:
+        Tuple of (kept posts, done) where done means the crawl has
+        crossed the cutoff or reached already-stored posts
+    """
+    kept = [
+        p for p in posts
+        if p["created_utc"] >= cutoff and (stop_at is None or p["created_utc"] > stop_at)
+    ]
+    return kept, len(kept) < len(posts)
+
+
+def crawl_reach(
+    cutoff: float,
+    stop_at: Optional[float],
+    done: bool,
+    after: Optional[str],
+    oldest: Optional[float],
+) -> Optional[float]:
+    """How far back a crawl that ends on this page saw every post.
+
+    Args:
+        cutoff, stop_at: As passed to take_page
+        done: take_page's done flag for this page
+        after: Cursor for the next page
+        oldest: Oldest created_utc seen so far
+
+    Returns:
+        max(cutoff, stop_at) if the page crossed either; at the end of
+        the listing the oldest post seen (Reddit ends listings after
+        ~1000 posts, so that is not the subreddit's first post), or
+        cutoff if the listing was empty; None if the crawl continues
+    """
+    if done:
+        return cutoff if stop_at is None else max(cutoff, stop_at)
+    if not after:
+        return cutoff if oldest is None else oldest
+    return None
+
+
+def record_crawl(
+    store: growth_store.GrowthStore,
+    sub: str,
+    reached: float,
+    stop_at: Optional[float],
+):
+    """Record how far back sub's stored history is complete after a crawl."""
+    store.record_crawl(sub, reached, joined=stop_at is not None and reached <= stop_at)
+
+
+def crawl_stop_at(store: growth_store.GrowthStore, sub: str) -> Optional[float]:
+    """created_utc an incremental crawl can stop at, or None for a full crawl.
+
+    SCORE_REFRESH_DAYS before the newest stored post, so recent posts
+    are re-read and their scores updated.
+    """
+    anchor = store.newest_post(sub)
+    if anchor is None:
         return None
+    return anchor["created_utc"] - SCORE_REFRESH_DAYS * 86400
+
+
+def crawl_subreddit_posts(
+    sub: str,
+    cutoff: float,
+    on_page: Callable[[List[Dict[str, Any]]], None],
+    stop_at: Optional[float] = None,
+    max_pages: int = MAX_PAGES,
+) -> Optional[float]:
+    """Walk a subreddit's new.json listing with after= cursors.
+
+    Pages are handed to on_page as they arrive and not retained, so
+    memory stays flat however deep the crawl goes. Stops at the first
+    post older than cutoff (or not newer than stop_at, see
+    crawl_stop_at), at the end of the listing, or after max_pages.
+
+    Args:
+        sub: Subreddit name (without r/)
+        cutoff: Oldest created_utc of interest
+        on_page: Called with each page's kept posts
+        stop_at: created_utc below which posts are already stored
+        max_pages: Page budget
+
+    Returns:
+        created_utc back to which the crawl saw every post (see
+        crawl_reach), or None if the first page failed
+    """
+    after = None
+    oldest = None
+    for page in range(max_pages):
+        data = fetch_posts_page(sub, after=after)
+        if data is None:
+            return oldest if page else None
+        posts = parse_subreddit_posts(data)
+        kept, done = take_page(posts, cutoff, stop_at)
+        if kept:
+            on_page(kept)
+        if posts:
+            oldest = min(p["created_utc"] for p in posts)
+        reach = crawl_reach(cutoff, stop_at, done, listing_after(data), oldest)
+        if reach is not None:
+            return reach
+        after = listing_after(data)
+    _log(f"r/{sub}: page budget ({max_pages}) reached before the cutoff")
+    return oldest
+
+
+def growth_from_counts(
+    about: Dict[str, Any],
+    subreddit: str,
+    recent_count: int,
+    recent_score: float,
+    older_count: int,
+    older_score: float,
+    window_days: int = GROWTH_DAYS,
+) -> schema.GrowthSignal:
+    """Build a GrowthSignal from per-window post counts and score sums.
+
+    Both windows must span window_days / 2, so count ratios are rate
+    ratios.
+    """
+    # Post rate acceleration
+    acceleration = recent_count / max(older_count, 1)
+
+    # Engagement acceleration
+    avg_score_recent = recent_score / max(recent_count, 1)
+    avg_score_older = older_score / max(older_count, 1)
+    engagement_accel = avg_score_recent / max(avg_score_older, 0.1)
+
+    # Vitality
+    subscribers = about.get("subscribers", 0)
+    active_users = about.get("active_users", 0)
+    vitality = active_users / max(subscribers, 1)
+
+    return schema.GrowthSignal(
+        subreddit=subreddit,
+        subscribers=subscribers,
+        active_users=active_users,
+        vitality=vitality,
+        acceleration=acceleration,
+        engagement_accel=engagement_accel,
+        recent_count=recent_count,
+        older_count=older_count,
+        window_days=window_days,
+    )
 
 
 def compute_growth(
@@ -90,6 +291,7 @@ def compute_growth(
     posts: List[Dict[str, Any]],
     subreddit: str,
     days: int = 180,
+    now: Optional[float] = None,
 ) -> schema.GrowthSignal:
     """Compute growth metrics from subreddit data.
 
@@ -100,64 +302,99 @@ def compute_growth(
         posts: List of posts with created_utc and score
         subreddit: Subreddit name
         days: Total window in days
+        now: Reference time (default: current time)
 
     Returns:
         GrowthSignal with computed metrics
     """
-    now = datetime.now(timezone.utc).timestamp()
+    if now is None:
+        now = datetime.now(timezone.utc).timestamp()
     half_days = days / 2
     midpoint = now - (half_days * 86400)
     cutoff = now - (days * 86400)
 
-    recent_posts = []
-    older_posts = []
-
+    recent_count = older_count = 0
+    recent_score = older_score = 0
     for post in posts:
         ts = post.get("created_utc", 0)
         if ts >= midpoint:
-            recent_posts.append(post)
+            recent_count += 1
+            recent_score += post.get("score", 0)
         elif ts >= cutoff:
-            older_posts.append(post)
+            older_count += 1
+            older_score += post.get("score", 0)
 
-    recent_count = len(recent_posts)
-    older_count = len(older_posts)
+    return growth_from_counts(
+        about, subreddit, recent_count, recent_score, older_count, older_score, window_days=int(days),
+    )
 
-    # Post rate acceleration
-    acceleration = recent_count / max(older_count, 1)
 
-    # Engagement acceleration
-    avg_score_recent = sum(p.get("score", 0) for p in recent_posts) / max(recent_count, 1)
-    avg_score_older = sum(p.get("score", 0) for p in older_posts) / max(older_count, 1)
-    engagement_accel = avg_score_recent / max(avg_score_older, 0.1)
+def growth_window(now: float, days: int, history_start: Optional[float]) -> Optional[int]:
+    """Days to compare: days, or the complete stored history if shorter.
 
-    # Vitality
-    subscribers = about.get("subscribers", 0)
-    active_users = about.get("active_users", 0)
-    vitality = active_users / max(subscribers, 1)
+    Returns:
+        Window in whole days, or None if less than MIN_HISTORY_DAYS of
+        history is complete (a half-covered older window would count
+        as a drop in posting and inflate acceleration)
+    """
+    if history_start is None:
+        return None
+    window = min(days, int((now - history_start) // 86400))
+    return window if window >= MIN_HISTORY_DAYS else None
 
-    return schema.GrowthSignal(
-        subreddit=subreddit,
-        subscribers=subscribers,
-        active_users=active_users,
-        vitality=vitality,
-        acceleration=acceleration,
-        engagement_accel=engagement_accel,
-        recent_count=recent_count,
-        older_count=older_count,
-    )
+
+def split_fresh(
+    subs: List[str],
+    max_age_hours: float = cache.GROWTH_CACHE_TTL_HOURS,
+    refresh: bool = False,
+) -> tuple:
+    """Split subreddits into cached-fresh signals and ones to rescan.
+
+    Returns:
+        Tuple of (fresh GrowthSignals, subreddits to scan)
+    """
+    if refresh:
+        return [], list(subs)
+    entries = cache.load_growth_cache()
+    now = time.time()
+    fresh, stale = [], []
+    for sub in subs:
+        entry = entries.get(sub.lower())
+        if entry and (now - entry.get("scanned_at", 0)) / 3600 < max_age_hours:
+            try:
+                fresh.append(schema.GrowthSignal.from_dict(entry["signal"]))
+                continue
+            except (KeyError, TypeError):
+                pass
+        stale.append(sub)
+    return fresh, stale
 
 
 def scan_growth(
     mock: bool = False,
     subreddits: Optional[List[str]] = None,
     progress_callback=None,
+    store: Optional[growth_store.GrowthStore] = None,
+    max_age_hours: float = cache.GROWTH_CACHE_TTL_HOURS,
+    refresh: bool = False,
 ) -> List[schema.GrowthSignal]:
     """Scan subreddits for growth signals.
 
+    Each subreddit's new.json listing is crawled page by page back to
+    the 180-day cutoff, or on later scans only back to SCORE_REFRESH_DAYS
+    before the newest stored post (refreshing recent scores), streaming
+    pages into the growth store. Growth for every scanned subreddit is
+    then computed in one batch from the stored history (see
+    growth_batch.growth_from_store). Subreddits whose cached signal is
+    younger than max_age_hours are not rescanned.
+
     Args:
         mock: If True, load from fixtures
         subreddits: Override subreddit list
         progress_callback: Optional callback(current, total) for progress updates
+        store: Growth history store (default: growth_store.get_store())
+        max_age_hours: Reuse cached signals younger than this
+        refresh: If True, rescan every subreddit
 
     Returns:
         List of GrowthSignal sorted by acceleration descending
@@ -167,27 +404,59 @@ def scan_growth(
     if mock:
         return _load_mock_growth()
 
-    signals = []
-    for i, sub in enumerate(subs):
-        if progress_callback:
-            progress_callback(i + 1, len(subs))
-
-        about = fetch_subreddit_about(sub)
-        if not about:
-            continue
-
-        time.sleep(RATE_LIMIT_DELAY)
-
-        posts = fetch_subreddit_posts(sub)
-        if posts is None:
-            continue
-
-        signal = compute_growth(about, posts, sub)
-        signals.append(signal)
+    fresh, subs = split_fresh(subs, max_age_hours, refresh)
+    total = len(fresh) + len(subs)
+    completed = len(fresh)
+    progress_lock = threading.Lock()
+    if fresh and progress_callback:
+        progress_callback(completed, total)
+    if not subs:
+        fresh.sort(key=lambda s: s.acceleration, reverse=True)
+        return fresh
+
+    from . import growth_batch
+
+    store = store or growth_store.get_store()
+    store.prune()
+
+    def _scan_one(executor, sub):
+        nonlocal completed
+        # Issue both requests for this subreddit side by side
+        about_future = executor.submit(timing.bind(fetch_subreddit_about), sub)
+        cutoff = datetime.now(timezone.utc).timestamp() - GROWTH_DAYS * 86400
+        stop_at = crawl_stop_at(store, sub)
+        reached = crawl_subreddit_posts(
+            sub, cutoff,
+            on_page=lambda page: store.record_posts(sub, page),
+            stop_at=stop_at,
+        )
+        if reached is not None:
+            record_crawl(store, sub, reached, stop_at)
+        about = about_future.result()
 
-        # Rate limit between subreddits
-        if i < len(subs) - 1:
-            time.sleep(RATE_LIMIT_DELAY)
+        if progress_callback:
+            with progress_lock:
+                completed += 1
+                progress_callback(completed, total)
+
+        if not about or reached is None:
+            return None
+        return about
+
+    abouts = {}
+    # Subreddit tasks plus one helper fetch each; the host limiter bounds the rate
+    with ThreadPoolExecutor(max_workers=GROWTH_WORKERS) as fetch_pool:
+        with ThreadPoolExecutor(max_workers=GROWTH_WORKERS) as sub_pool:
+            futures = [sub_pool.submit(timing.bind(_scan_one), fetch_pool, sub) for sub in subs]
+            for sub, future in zip(subs, futures):
+                about = future.result()
+                if about:
+                    abouts[sub] = about
+
+    signals = growth_batch.growth_from_store(store, abouts, GROWTH_DAYS)
+
+    cache.save_growth_signals([s.to_dict() for s in signals])
+    signals.extend(fresh)
 
     # Sort by acceleration descending
     signals.sort(key=lambda s: s.acceleration, reverse=True)
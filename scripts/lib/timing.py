@@ -0,0 +1,232 @@
+"""Per-phase and per-request timing for saas-radar skill."""
+
+import cProfile
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+ENABLED = False
+
+
+class Collector:
+    """Spans and requests recorded for one run."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.origin = time.monotonic()
+        self.open: Dict[str, float] = {}
+        self.spans: List[Dict[str, Any]] = []
+        self.requests: List[Dict[str, Any]] = []
+
+
+# Process-wide collector, used unless collect() scoped a run-local one
+_global = Collector()
+_current: ContextVar[Optional[Collector]] = ContextVar("timing_collector", default=None)
+
+
+def _collector() -> Collector:
+    return _current.get() or _global
+
+
+# cProfile only sees the thread it is enabled on, so every bind()-wrapped
+# worker call gets its own profiler, merged into _profile_stats when done
+_profiling = False
+_profile_lock = threading.Lock()
+_profile_stats: Optional[pstats.Stats] = None
+_thread = threading.local()
+
+
+def _merge_profile(profiler: cProfile.Profile):
+    global _profile_stats
+    with _profile_lock:
+        if _profile_stats is None:
+            _profile_stats = pstats.Stats(profiler)
+        else:
+            _profile_stats.add(profiler)
+
+
+def _call_profiled(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call fn under a profiler unless this thread is already profiled."""
+    if not _profiling or getattr(_thread, "profiler", None) is not None:
+        return fn(*args, **kwargs)
+    profiler = _thread.profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        profiler.disable()
+        _thread.profiler = None
+        _merge_profile(profiler)
+
+
+def start_profiling():
+    """Profile the calling thread and every bind()-wrapped call from now on."""
+    global _profiling, _profile_stats
+    _profile_stats = None
+    _profiling = True
+    _thread.profiler = cProfile.Profile()
+    _thread.profiler.enable()
+
+
+def stop_profiling() -> Optional[pstats.Stats]:
+    """Stop profiling and return stats merged across all profiled threads."""
+    global _profiling
+    _profiling = False
+    profiler = getattr(_thread, "profiler", None)
+    if profiler is not None:
+        profiler.disable()
+        _thread.profiler = None
+        _merge_profile(profiler)
+    return _profile_stats
+
+
+def enable():
+    """Turn on timing collection and reset recorded data."""
+    global ENABLED
+    ENABLED = True
+    reset()
+
+
+def reset():
+    """Clear the process-wide collector."""
+    global _global
+    _global = Collector()
+
+
+@contextmanager
+def collect():
+    """Record spans and requests made in this block into a fresh collector.
+
+    Lets concurrent runs (batch topics, daemon jobs) each get their own
+    summary(). The collector follows asyncio tasks automatically; work
+    handed to thread pools must be wrapped with bind().
+    """
+    token = _current.set(Collector())
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def bind(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap fn to record into the caller's collector on whatever thread runs it.
+
+    While profiling, the wrapped call is also profiled on that thread.
+    """
+    collector = _current.get()
+    if collector is None and not _profiling:
+        return fn
+
+    def _bound(*args, **kwargs):
+        token = _current.set(collector)
+        try:
+            return _call_profiled(fn, *args, **kwargs)
+        finally:
+            _current.reset(token)
+
+    return _bound
+
+
+def start(name: str):
+    """Mark the start of a named span."""
+    if not ENABLED:
+        return
+    collector = _collector()
+    with collector.lock:
+        collector.open[name] = time.monotonic()
+
+
+def end(name: str):
+    """Close a named span started with start()."""
+    if not ENABLED:
+        return
+    now = time.monotonic()
+    collector = _collector()
+    with collector.lock:
+        began = collector.open.pop(name, None)
+        if began is not None:
+            collector.spans.append({
+                "name": name,
+                "start": round(began - collector.origin, 4),
+                "duration": round(now - began, 4),
+            })
+
+
+@contextmanager
+def span(name: str):
+    """Time a block as a named span."""
+    start(name)
+    try:
+        yield
+    finally:
+        end(name)
+
+
+def record_request(
+    method: str,
+    url: str,
+    status: Optional[int],
+    elapsed: float,
+    nbytes: int,
+    retries: int,
+    decoded_bytes: Optional[int] = None,
+):
+    """Record one logical HTTP request (including its retries).
+
+    nbytes counts bytes on the wire; decoded_bytes the body size after
+    Content-Encoding decoding (defaults to nbytes).
+    """
+    if not ENABLED:
+        return
+    parts = urlsplit(url)
+    collector = _collector()
+    with collector.lock:
+        collector.requests.append({
+            "method": method,
+            "host": parts.hostname or "",
+            "path": parts.path,
+            "status": status,
+            "duration": round(elapsed, 4),
+            "bytes": nbytes,
+            "decoded_bytes": nbytes if decoded_bytes is None else decoded_bytes,
+            "retries": retries,
+        })
+
+
+def summary() -> Dict[str, Any]:
+    """Summarize the current collector's timings as a JSON-serializable dict."""
+    collector = _collector()
+    with collector.lock:
+        spans = sorted(collector.spans, key=lambda s: s["start"])
+        requests = list(collector.requests)
+        total = time.monotonic() - collector.origin
+
+    by_host: Dict[str, Dict[str, Any]] = {}
+    for r in requests:
+        host = by_host.setdefault(r["host"], {
+            "calls": 0, "time": 0.0, "bytes": 0, "decoded_bytes": 0, "retries": 0, "errors": 0,
+        })
+        host["calls"] += 1
+        host["time"] = round(host["time"] + r["duration"], 4)
+        host["bytes"] += r["bytes"]
+        host["decoded_bytes"] += r["decoded_bytes"]
+        host["retries"] += r["retries"]
+        if r["status"] is None or r["status"] >= 400:
+            host["errors"] += 1
+
+    return {
+        "total": round(total, 4),
+        "phases": spans,
+        "http": {
+            "calls": len(requests),
+            "bytes": sum(r["bytes"] for r in requests),
+            "decoded_bytes": sum(r["decoded_bytes"] for r in requests),
+            "retries": sum(r["retries"] for r in requests),
+            "by_host": by_host,
+            "requests": requests,
+        },
+    }
@@ -4,7 +4,9 @@ import sys
 import time
 import threading
 import random
-from typing import Optional
+from typing import Dict, Optional
+
+from . import timing
 
 # Check if we're in a real terminal (not captured by Claude Code)
 IS_TTY = sys.stderr.isatty()
@@ -68,6 +70,11 @@ PROCESSING_MESSAGES = [
 # Spinner frames
 SPINNER_FRAMES = ['|', '/', '-', '\\']
 
+# Running spinners; only the most recently started one animates so
+# concurrent phases don't fight over the same terminal line
+_active_spinners = []
+_active_lock = threading.Lock()
+
 
 class Spinner:
     """Animated spinner for long-running operations."""
@@ -80,8 +87,15 @@ class Spinner:
         self.frame_idx = 0
         self.shown_static = False
 
+    def _is_foreground(self) -> bool:
+        with _active_lock:
+            return bool(_active_spinners) and _active_spinners[-1] is self
+
     def _spin(self):
         while self.running:
+            if not self._is_foreground():
+                time.sleep(0.08)
+                continue
             frame = SPINNER_FRAMES[self.frame_idx % len(SPINNER_FRAMES)]
             sys.stderr.write(f"\r{self.color}{frame}{Colors.RESET} {self.message}  ")
             sys.stderr.flush()
@@ -90,6 +104,8 @@ class Spinner:
 
     def start(self):
         self.running = True
+        with _active_lock:
+            _active_spinners.append(self)
         if IS_TTY:
             # Real terminal - animate
             self.thread = threading.Thread(target=self._spin, daemon=True)
@@ -109,6 +125,9 @@ class Spinner:
 
     def stop(self, final_message: str = ""):
         self.running = False
+        with _active_lock:
+            if self in _active_spinners:
+                _active_spinners.remove(self)
         if self.thread:
             self.thread.join(timeout=0.2)
         if IS_TTY:
@@ -124,6 +143,7 @@ class ProgressDisplay:
     def __init__(self, topic: str, show_banner: bool = True):
         self.topic = topic
         self.spinner: Optional[Spinner] = None
+        self.spinners: Dict[str, Spinner] = {}
         self.start_time = time.time()
 
         if show_banner:
@@ -137,62 +157,67 @@ class ProgressDisplay:
             sys.stderr.write(f"/saasradar - scanning: {self.topic}\n")
         sys.stderr.flush()
 
+    def _start_phase(self, phase: str, message: str, color: str):
+        timing.start(phase)
+        spinner = Spinner(message, color)
+        self.spinners[phase] = spinner
+        self.spinner = spinner
+        spinner.start()
+
+    def _update_phase(self, phase: str, message: str):
+        spinner = self.spinners.get(phase)
+        if spinner:
+            spinner.update(message)
+
+    def _end_phase(self, phase: str, final_message: str = ""):
+        timing.end(phase)
+        spinner = self.spinners.pop(phase, None)
+        if spinner:
+            spinner.stop(final_message)
+
     def start_growth_scan(self):
         msg = random.choice(GROWTH_MESSAGES)
-        self.spinner = Spinner(f"{Colors.GREEN}Growth{Colors.RESET} {msg}", Colors.GREEN)
-        self.spinner.start()
+        self._start_phase("growth", f"{Colors.GREEN}Growth{Colors.RESET} {msg}", Colors.GREEN)
 
     def update_growth_scan(self, current: int, total: int):
-        if self.spinner:
-            msg = random.choice(GROWTH_MESSAGES)
-            self.spinner.update(f"{Colors.GREEN}Growth{Colors.RESET} [{current}/{total}] {msg}")
+        msg = random.choice(GROWTH_MESSAGES)
+        self._update_phase("growth", f"{Colors.GREEN}Growth{Colors.RESET} [{current}/{total}] {msg}")
 
     def end_growth_scan(self, count: int):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.GREEN}Growth{Colors.RESET} Scanned {count} subreddits")
+        self._end_phase("growth", f"{Colors.GREEN}Growth{Colors.RESET} Scanned {count} subreddits")
 
     def start_reddit(self):
         msg = random.choice(REDDIT_MESSAGES)
-        self.spinner = Spinner(f"{Colors.YELLOW}Reddit{Colors.RESET} {msg}", Colors.YELLOW)
-        self.spinner.start()
+        self._start_phase("reddit", f"{Colors.YELLOW}Reddit{Colors.RESET} {msg}", Colors.YELLOW)
 
     def end_reddit(self, count: int):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.YELLOW}Reddit{Colors.RESET} Found {count} threads")
+        self._end_phase("reddit", f"{Colors.YELLOW}Reddit{Colors.RESET} Found {count} threads")
 
     def start_reddit_enrich(self, current: int, total: int):
-        if self.spinner:
-            self.spinner.stop()
+        self._end_phase("reddit")
         msg = random.choice(ENRICHING_MESSAGES)
-        self.spinner = Spinner(f"{Colors.YELLOW}Reddit{Colors.RESET} [{current}/{total}] {msg}", Colors.YELLOW)
-        self.spinner.start()
+        self._start_phase("enrich", f"{Colors.YELLOW}Reddit{Colors.RESET} [{current}/{total}] {msg}", Colors.YELLOW)
 
     def update_reddit_enrich(self, current: int, total: int):
-        if self.spinner:
-            msg = random.choice(ENRICHING_MESSAGES)
-            self.spinner.update(f"{Colors.YELLOW}Reddit{Colors.RESET} [{current}/{total}] {msg}")
+        msg = random.choice(ENRICHING_MESSAGES)
+        self._update_phase("enrich", f"{Colors.YELLOW}Reddit{Colors.RESET} [{current}/{total}] {msg}")
 
     def end_reddit_enrich(self):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.YELLOW}Reddit{Colors.RESET} Enriched with engagement data")
+        self._end_phase("enrich", f"{Colors.YELLOW}Reddit{Colors.RESET} Enriched with engagement data")
 
     def start_x(self):
         msg = random.choice(X_MESSAGES)
-        self.spinner = Spinner(f"{Colors.CYAN}X{Colors.RESET} {msg}", Colors.CYAN)
-        self.spinner.start()
+        self._start_phase("x", f"{Colors.CYAN}X{Colors.RESET} {msg}", Colors.CYAN)
 
     def end_x(self, count: int):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.CYAN}X{Colors.RESET} Found {count} posts")
+        self._end_phase("x", f"{Colors.CYAN}X{Colors.RESET} Found {count} posts")
 
     def start_processing(self):
         msg = random.choice(PROCESSING_MESSAGES)
-        self.spinner = Spinner(f"{Colors.PURPLE}Processing{Colors.RESET} {msg}", Colors.PURPLE)
-        self.spinner.start()
+        self._start_phase("processing", f"{Colors.PURPLE}Processing{Colors.RESET} {msg}", Colors.PURPLE)
 
     def end_processing(self):
-        if self.spinner:
-            self.spinner.stop()
+        self._end_phase("processing")
 
     def show_complete(self, item_count: int, growth_count: int):
         elapsed = time.time() - self.start_time
@@ -205,6 +230,13 @@ class ProgressDisplay:
             sys.stderr.write(f"[ok] SaaS Radar complete ({elapsed:.1f}s) - {item_count} ideas, {growth_count} subreddits\n")
         sys.stderr.flush()
 
+    def show_cached(self, age_hours: float):
+        if IS_TTY:
+            sys.stderr.write(f"{Colors.GREEN}[ok]{Colors.RESET} Using cached report {Colors.DIM}({age_hours:.1f}h old, --refresh to rerun){Colors.RESET}\n")
+        else:
+            sys.stderr.write(f"[ok] Using cached report ({age_hours:.1f}h old, --refresh to rerun)\n")
+        sys.stderr.flush()
+
     def show_error(self, message: str):
         sys.stderr.write(f"{Colors.RED}[error] Error:{Colors.RESET} {message}\n")
         sys.stderr.flush()
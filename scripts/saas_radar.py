@@ -4,6 +4,9 @@ saas-radar - Discover micro-SaaS ideas from Reddit + X threads.
 
 Usage:
     python3 saas_radar.py <topic> [options]
+    python3 saas_radar.py <topic> <topic> ... [options]
+    python3 saas_radar.py --topics-file=FILE [options]
+    python3 saas_radar.py --serve [--port=N] [options]
 
 Options:
     --mock              Use fixtures instead of real API calls
@@ -12,15 +15,31 @@ Options:
     --quick             Faster research with fewer sources
     --deep              Comprehensive research with more sources
     --debug             Enable verbose debug logging
+    --enrich-workers=N  Concurrent Reddit enrichment fetches (default: 6; not used with --async)
+    --refresh           Ignore cached reports/threads and run a fresh search
+    --max-age=HOURS     Max age of a cached report to reuse (default: 24)
+    --refresh-growth    Rescan every subreddit instead of reusing cached growth
+    --growth-max-age=H  Max age of cached per-subreddit growth signals (default: 12)
+    --discover          Also scan subreddits discovered from search results and links
+    --async             Run network phases as asyncio tasks on one event loop
+    --profile           Report per-phase/HTTP timing and write profile.pstats
+    --topics-file=FILE  Read topics from FILE, one per line (# for comments)
+    --batch-workers=N   Topics researched concurrently (default: 3 in batch mode, 4 with --serve)
+    --serve             Run a local HTTP/JSON daemon with warm caches
+    --port=N            Port for --serve (default: 8765)
 """
 
 import argparse
+import asyncio
 import io
 import json
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Awaitable, Callable, List, Optional
 
 # Force UTF-8 on Windows to handle Unicode from Reddit/X content
 if sys.platform == "win32":
@@ -32,6 +51,8 @@ SCRIPT_DIR = Path(__file__).parent.resolve()
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from lib import (
+    async_pipeline,
+    cache,
     dates,
     dedupe,
     env,
@@ -42,13 +63,20 @@ from lib import (
     openai_reddit,
     reddit_enrich,
     render,
+    scheduler,
     schema,
     score,
+    server,
+    subreddit_discovery,
     subreddit_growth,
+    timing,
     ui,
     xai_x,
 )
 
+BATCH_WORKERS = 3  # Topics researched concurrently in batch mode
+SERVE_GROWTH_TTL_HOURS = 6  # Daemon rescans subreddit growth after this
+
 
 def load_fixture(name: str) -> dict:
     """Load a fixture file."""
@@ -143,11 +171,174 @@ def _search_x(
     return x_items, raw_xai, x_error
 
 
+async def _run_phases_async(
+    args: argparse.Namespace,
+    depth: str,
+    topic: str,
+    config: dict,
+    setup: dict,
+    available: str,
+    missing_keys: str,
+    from_date: str,
+    to_date: str,
+    run_reddit: bool,
+    run_x: bool,
+    progress: ui.ProgressDisplay,
+    after_reddit_search,
+    on_enrich_error,
+    mock_thread: dict,
+    finish: Callable[[dict], Awaitable[Any]],
+    shared: Optional[dict] = None,
+) -> Any:
+    """Run growth scan, searches and enrichment as tasks on one event loop.
+
+    Same dependency graph as the threaded PhaseScheduler path. The two
+    LLM searches are single long blocking calls and run via
+    asyncio.to_thread (bound so --profile sees them); all Reddit traffic
+    runs on the loop itself. Processing and the comment fetch run on
+    the same loop through finish.
+
+    Args:
+        finish: Coroutine function called with a dict of phase name ->
+            completed concurrent.futures.Future once every phase is done
+
+    Returns:
+        Result of finish
+    """
+    async def _growth():
+        if shared is not None:
+            return shared["growth"]
+        signals = await async_pipeline.scan_growth_async(
+            mock=args.mock,
+            subreddits=await asyncio.to_thread(timing.bind(_growth_subreddits), args),
+            progress_callback=progress.update_growth_scan,
+            max_age_hours=args.growth_max_age,
+            refresh=args.refresh_growth,
+        )
+        progress.end_growth_scan(len(signals))
+        return signals
+
+    growth_task = asyncio.create_task(_growth())
+    if shared is not None:
+        models_task = asyncio.create_task(asyncio.to_thread(lambda: shared["models"]))
+    else:
+        models_task = asyncio.create_task(asyncio.to_thread(
+            timing.bind(_select_models), args.mock, setup, config, available, missing_keys,
+        ))
+    tasks = {"growth": growth_task, "models": models_task}
+
+    async def _enrich():
+        selected_models = await models_task
+        growth_signals = await growth_task
+        progress.start_reddit()
+        result = await asyncio.to_thread(
+            timing.bind(_search_reddit), topic, config, selected_models,
+            from_date, to_date, depth, args.mock, growth_signals,
+        )
+        items = after_reddit_search(result)
+        if items:
+            progress.start_reddit_enrich(1, len(items))
+            items = await async_pipeline.enrich_reddit_items_async(
+                items,
+                mock_thread_data=mock_thread,
+                progress_callback=progress.update_reddit_enrich,
+                error_callback=on_enrich_error,
+                use_cache=not args.refresh,
+                comments=False,
+            )
+            progress.end_reddit_enrich()
+        return items, result[1], result[2]
+
+    async def _x():
+        selected_models = await models_task
+        progress.start_x()
+        return await asyncio.to_thread(
+            timing.bind(_search_x), topic, config, selected_models,
+            from_date, to_date, depth, args.mock,
+        )
+
+    if run_reddit:
+        tasks["enrich"] = asyncio.create_task(_enrich())
+    if run_x:
+        tasks["x"] = asyncio.create_task(_x())
+
+    await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    # Hand back plain futures so callers treat both modes the same
+    phases = {}
+    for name, task in tasks.items():
+        future = Future()
+        if task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+        phases[name] = future
+    return await finish(phases)
+
+
+def _growth_subreddits(args: argparse.Namespace) -> Optional[List[str]]:
+    """Subreddits for the growth scan: defaults plus discovered ones with --discover.
+
+    Returns:
+        Subreddit list, or None for subreddit_growth.SAAS_SUBREDDITS
+    """
+    if not args.discover or args.mock:
+        return None
+    discovered = subreddit_discovery.discover_subreddits(refresh=args.refresh_growth)
+    return subreddit_discovery.growth_subreddits(discovered)
+
+
+def _select_models(
+    mock: bool,
+    setup: dict,
+    config: dict,
+    available: str,
+    missing_keys: str,
+) -> dict:
+    """Select models for both providers (runs in thread).
+
+    Returns:
+        Dict with 'openai' and 'xai' model IDs
+    """
+    if mock:
+        mock_openai_models = load_fixture("models_openai_sample.json").get("data", [])
+        mock_xai_models = load_fixture("models_xai_sample.json").get("data", [])
+        return models.get_models(
+            {"OPENAI_API_KEY": "mock", "XAI_API_KEY": "mock", **config},
+            mock_openai_models,
+            mock_xai_models,
+        )
+
+    if setup:
+        return setup["models"]
+
+    selected_models = models.get_models(config)
+
+    # Cache for next run
+    env.save_setup_cache({
+        "available": available,
+        "missing_keys": missing_keys,
+        "models": selected_models,
+        "has_openai": bool(config.get("OPENAI_API_KEY")),
+        "has_xai": bool(config.get("XAI_API_KEY")),
+    })
+
+    return selected_models
+
+
+def _emit(report: schema.SaaSReport, emit: str, missing_keys: str):
+    """Print the report to stdout in the requested mode."""
+    if emit == "compact":
+        print(render.render_compact(report, missing_keys=missing_keys))
+    elif emit == "json":
+        print(json.dumps(report.to_dict(), indent=2))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Discover micro-SaaS ideas from Reddit + X"
     )
-    parser.add_argument("topic", nargs="?", help="Topic to search for SaaS ideas")
+    parser.add_argument("topics", nargs="*", metavar="topic", help="Topic(s) to search for SaaS ideas")
     parser.add_argument("--mock", action="store_true", help="Use fixtures")
     parser.add_argument(
         "--emit",
@@ -164,6 +355,52 @@ def main():
     parser.add_argument("--quick", action="store_true", help="Fewer sources")
     parser.add_argument("--deep", action="store_true", help="More sources")
     parser.add_argument("--debug", action="store_true", help="Debug logging")
+    parser.add_argument(
+        "--enrich-workers",
+        type=int,
+        default=reddit_enrich.ENRICH_WORKERS,
+        help="Concurrent Reddit thread fetches during enrichment (ignored with --async, "
+        "which bounds in-flight requests per host instead)",
+    )
+    parser.add_argument("--refresh", action="store_true", help="Bypass report and thread caches")
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=cache.DEFAULT_TTL_HOURS,
+        help="Max age in hours of a cached report to reuse",
+    )
+    parser.add_argument("--refresh-growth", action="store_true", help="Bypass the growth signal cache")
+    parser.add_argument(
+        "--growth-max-age",
+        type=float,
+        default=cache.GROWTH_CACHE_TTL_HOURS,
+        help="Max age in hours of a cached subreddit growth signal to reuse",
+    )
+    parser.add_argument(
+        "--discover",
+        action="store_true",
+        help="Add subreddits discovered from search results, sidebars and related links to the growth scan",
+    )
+    parser.add_argument(
+        "--async",
+        dest="async_mode",
+        action="store_true",
+        help="Run growth scan, searches and enrichment on one asyncio event loop",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Add per-phase/HTTP timing to the report and dump cProfile stats",
+    )
+    parser.add_argument("--topics-file", help="File with one topic per line (batch mode)")
+    parser.add_argument(
+        "--batch-workers",
+        type=int,
+        help=f"Topics researched concurrently (default: {BATCH_WORKERS} in batch mode, "
+        f"{server.SERVE_WORKERS} with --serve)",
+    )
+    parser.add_argument("--serve", action="store_true", help="Run the local HTTP/JSON daemon")
+    parser.add_argument("--port", type=int, default=server.DEFAULT_PORT, help="Port for --serve")
 
     args = parser.parse_args()
 
@@ -184,13 +421,197 @@ def main():
     else:
         depth = "default"
 
-    if not args.topic:
+    if args.serve:
+        _serve(args, depth)
+        return
+
+    topics = list(args.topics)
+    if args.topics_file:
+        try:
+            topics.extend(_read_topics_file(args.topics_file))
+        except OSError as e:
+            print(f"Error: Cannot read topics file: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    # Repeated topics would race on the same output directory
+    topics = list(dict.fromkeys(topics))
+    if not topics:
         print("Error: Please provide a topic.", file=sys.stderr)
         print("Usage: python3 saas_radar.py <topic> [options]", file=sys.stderr)
         sys.exit(1)
 
-    # -- Phase 1: Config & Setup --
+    if args.profile:
+        timing.enable()
+        timing.start_profiling()
+        try:
+            _main_topics(args, depth, topics)
+        finally:
+            profile_path = render.write_profile(timing.stop_profiling())
+            print(f"Profile written to {profile_path}", file=sys.stderr)
+    else:
+        _main_topics(args, depth, topics)
+
+
+def _read_topics_file(path: str) -> List[str]:
+    """Read topics from a file, one per line, skipping blanks and # comments."""
+    topics = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                topics.append(line)
+    return topics
+
+
+def _main_topics(args: argparse.Namespace, depth: str, topics: List[str]):
+    """Run one topic directly, or several in batch mode, and emit output."""
+    ctx = _load_setup(args)
+    if len(topics) == 1:
+        report = _run(args, depth, topics[0], ctx)
+        _emit(report, args.emit, ctx["missing_keys"])
+    else:
+        _run_batch(args, depth, topics, ctx)
+
+
+def _serve(args: argparse.Namespace, depth: str):
+    """Run the HTTP/JSON daemon (see lib/server.py).
+
+    Setup and model selection happen once at startup, growth signals
+    are rescanned every SERVE_GROWTH_TTL_HOURS, and the report and
+    thread caches are kept in memory, so repeat queries for a topic
+    are answered without touching the network or re-parsing JSON.
+    """
+    ctx = _load_setup(args)
+    cache.enable_memory_cache()
+    selected_models = _select_models(
+        args.mock, ctx["setup"], ctx["config"], ctx["available"], ctx["missing_keys"],
+    )
 
+    warm = {"growth": None, "scanned_at": 0.0}
+    growth_lock = threading.Lock()
+
+    def _shared() -> dict:
+        with growth_lock:
+            age_hours = (time.time() - warm["scanned_at"]) / 3600
+            if warm["growth"] is None or age_hours >= SERVE_GROWTH_TTL_HOURS:
+                warm["growth"] = subreddit_growth.scan_growth(
+                    mock=args.mock,
+                    subreddits=_growth_subreddits(args),
+                    max_age_hours=args.growth_max_age,
+                    refresh=args.refresh_growth and warm["growth"] is None,
+                )
+                warm["scanned_at"] = time.time()
+            return {"growth": warm["growth"], "models": selected_models}
+
+    def _runner(topic: str, options: dict) -> dict:
+        job_args = argparse.Namespace(**vars(args))
+        job_args.refresh = args.refresh or options["refresh"]
+        out_dir = render.OUTPUT_DIR / "topics" / render.topic_slug(topic)
+        shared = _shared()
+        with timing.collect():
+            report = _run(
+                job_args, options["depth"] or depth, topic, ctx,
+                shared=shared, out_dir=out_dir,
+            )
+        return report.to_dict()
+
+    workers = args.batch_workers if args.batch_workers is not None else server.SERVE_WORKERS
+    try:
+        server.serve(_runner, port=args.port, max_workers=max(1, workers))
+    finally:
+        http.close_connections()
+
+
+def _run_batch(args: argparse.Namespace, depth: str, topics: List[str], ctx: dict):
+    """Research several topics, sharing the growth scan, models and connections.
+
+    The growth scan and model selection run once; topics then fan out
+    across a small worker pool. The HTTP connection pool, thread cache
+    and report cache are process-wide, so threads seen by more than one
+    topic are fetched once. Each topic writes its own report under
+    OUTPUT_DIR/topics/<slug>/ and a failure in one topic does not stop
+    the others.
+
+    Args:
+        args: Parsed CLI arguments
+        depth: 'quick', 'default' or 'deep'
+        topics: Topics to research
+        ctx: Result of _load_setup()
+    """
+    missing_keys = ctx["missing_keys"]
+    progress = ui.ProgressDisplay(f"{len(topics)} topics", show_banner=True)
+    if missing_keys != 'none' and not args.mock:
+        progress.show_promo(missing_keys)
+
+    # Shared phases: one growth scan and one model selection for all topics
+    with scheduler.PhaseScheduler(max_workers=2) as sched:
+        def _run_growth():
+            progress.start_growth_scan()
+            signals = subreddit_growth.scan_growth(
+                mock=args.mock,
+                subreddits=_growth_subreddits(args),
+                progress_callback=progress.update_growth_scan,
+                max_age_hours=args.growth_max_age,
+                refresh=args.refresh_growth,
+            )
+            progress.end_growth_scan(len(signals))
+            return signals
+
+        sched.add("growth", _run_growth)
+        sched.add(
+            "models",
+            _select_models,
+            args.mock, ctx["setup"], ctx["config"], ctx["available"], missing_keys,
+        )
+
+    shared = {}
+    for name in ("growth", "models"):
+        try:
+            shared[name] = sched.result(name)
+        except Exception as e:
+            print(f"Error: {name} phase failed: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    def _one(topic: str) -> schema.SaaSReport:
+        out_dir = render.OUTPUT_DIR / "topics" / render.topic_slug(topic)
+        # Each topic's --profile timing covers only its own phases and requests
+        with timing.collect():
+            return _run(args, depth, topic, ctx, shared=shared, out_dir=out_dir)
+
+    reports = []
+    workers = args.batch_workers if args.batch_workers is not None else BATCH_WORKERS
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(timing.bind(_one), topic) for topic in topics]
+        for topic, future in zip(topics, futures):
+            try:
+                reports.append(future.result())
+            except Exception as e:
+                progress.show_error(f"{topic}: {type(e).__name__}: {e}")
+                reports.append(None)
+
+    if args.emit == "json":
+        print(json.dumps(
+            [r.to_dict() if r else {"topic": t, "error": "failed"} for t, r in zip(topics, reports)],
+            indent=2,
+        ))
+    else:
+        for i, (topic, report) in enumerate(zip(topics, reports)):
+            if i:
+                print("\n---\n")
+            if report:
+                _emit(report, "compact", missing_keys)
+            else:
+                print(f"# {topic}\n\nResearch failed for this topic.")
+
+
+def _load_setup(args: argparse.Namespace) -> dict:
+    """Load config, available sources and setup cache (Phase 1).
+
+    Exits with an error if the requested sources are unavailable.
+
+    Returns:
+        Dict with config, setup, available, missing_keys and sources
+    """
     setup = env.load_setup_cache() if not args.mock and not args.debug else None
 
     if setup:
@@ -198,7 +619,6 @@ def main():
         config = env.get_config()
         available = setup["available"]
         missing_keys = setup["missing_keys"]
-        selected_models = setup["models"]
     else:
         # Slow path: full env check + model discovery
         config = env.get_config()
@@ -216,34 +636,73 @@ def main():
             print(f"Error: {error}", file=sys.stderr)
             sys.exit(1)
 
+    return {
+        "config": config,
+        "setup": setup,
+        "available": available,
+        "missing_keys": missing_keys,
+        "sources": sources,
+    }
+
+
+def _run(
+    args: argparse.Namespace,
+    depth: str,
+    topic: str,
+    ctx: dict,
+    shared: Optional[dict] = None,
+    out_dir: Optional[Path] = None,
+) -> schema.SaaSReport:
+    """Run the full pipeline for one topic.
+
+    Args:
+        args: Parsed CLI arguments
+        depth: 'quick', 'default' or 'deep'
+        topic: Topic to search
+        ctx: Result of _load_setup()
+        shared: Optional precomputed {'growth': signals, 'models': models}
+            reused across topics in batch mode
+        out_dir: Output directory override for write_outputs
+
+    Returns:
+        The finished (or cached) report
+    """
+    config = ctx["config"]
+    setup = ctx["setup"]
+    available = ctx["available"]
+    missing_keys = ctx["missing_keys"]
+    sources = ctx["sources"]
+
     from_date, to_date = dates.get_date_range(180)
 
     # Initialize progress
-    progress = ui.ProgressDisplay(args.topic, show_banner=True)
+    progress = ui.ProgressDisplay(topic, show_banner=True)
 
-    if missing_keys != 'none' and not args.mock:
+    if missing_keys != 'none' and not args.mock and shared is None:
         progress.show_promo(missing_keys)
 
-    # Select models
-    if args.mock:
-        mock_openai_models = load_fixture("models_openai_sample.json").get("data", [])
-        mock_xai_models = load_fixture("models_xai_sample.json").get("data", [])
-        selected_models = models.get_models(
-            {"OPENAI_API_KEY": "mock", "XAI_API_KEY": "mock", **config},
-            mock_openai_models,
-            mock_xai_models,
-        )
-    elif not setup:
-        selected_models = models.get_models(config)
-
-        # Cache for next run
-        env.save_setup_cache({
-            "available": available,
-            "missing_keys": missing_keys,
-            "models": selected_models,
-            "has_openai": bool(config.get("OPENAI_API_KEY")),
-            "has_xai": bool(config.get("XAI_API_KEY")),
-        })
+    # Report cache: reuse a recent identical query
+    cache_key = cache.get_cache_key(
+        topic, from_date, to_date, sources, depth, discover=args.discover and not args.mock,
+    )
+    use_cache = not args.mock and not args.refresh
+
+    if use_cache:
+        cached, age_hours = cache.load_cache_with_age(cache_key, args.max_age)
+        if cached:
+            try:
+                report = schema.SaaSReport.from_dict(cached)
+            except (KeyError, TypeError, ValueError):
+                report = None
+            if report:
+                report.from_cache = True
+                report.cache_age_hours = round(age_hours, 2)
+                progress.show_cached(age_hours)
+                if timing.ENABLED:
+                    report.timing = timing.summary()
+                render.write_outputs(report, out_dir=out_dir)
+                progress.show_complete(len(report.items), len(report.growth_signals))
+                return report
 
     # Determine mode string
     if sources == "both":
@@ -255,17 +714,11 @@ def main():
     else:
         mode = sources
 
-    # -- Phase 2: Subreddit Growth Scan --
-
-    progress.start_growth_scan()
-    growth_signals = subreddit_growth.scan_growth(
-        mock=args.mock,
-        progress_callback=progress.update_growth_scan,
-    )
-    progress.end_growth_scan(len(growth_signals))
-    growth_map = {g.subreddit: g.acceleration for g in growth_signals}
-
-    # -- Phase 3: Parallel Search (Reddit + X) --
+    # -- Phase 2-4: Growth Scan, Parallel Search (Reddit + X), Enrichment --
+    # Phases start as soon as their inputs are ready: model selection and
+    # the growth scan begin immediately, X search needs only the models,
+    # Reddit search also waits for growth signals to rank subreddits, and
+    # Reddit enrichment streams in right behind it while X is in flight.
 
     run_reddit = sources in ("both", "reddit")
     run_x = sources in ("both", "x")
@@ -277,38 +730,47 @@ def main():
     raw_reddit_enriched = []
     reddit_error = None
     x_error = None
+    growth_signals = []
+    selected_models = {}
 
-    reddit_future = None
-    x_future = None
+    def _on_enrich_error(item, e):
+        progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        if run_reddit:
-            progress.start_reddit()
-            reddit_future = executor.submit(
-                _search_reddit, args.topic, config, selected_models,
-                from_date, to_date, depth, args.mock, growth_signals
-            )
+    def _on_comments_error(item, e):
+        progress.show_error(f"Comments failed for {item.url or 'unknown'}: {e}")
 
-        if run_x:
-            progress.start_x()
-            x_future = executor.submit(
-                _search_x, args.topic, config, selected_models,
-                from_date, to_date, depth, args.mock
-            )
+    def _after_reddit_search(result):
+        items, raw, error = result
+        if error:
+            progress.show_error(f"Reddit: {error}")
+        progress.end_reddit(len(items))
+        if args.discover and not args.mock:
+            subreddit_discovery.record_search_results(items)
+        return items
+
+    mock_thread = load_fixture("reddit_thread_sample.json") if args.mock else None
+
+    def _finish(phases: dict) -> List[schema.SaaSIdeaItem]:
+        """Collect phase results, then normalize, cluster, score and dedupe."""
+        nonlocal growth_signals, selected_models, reddit_items, raw_openai, reddit_error
+        nonlocal raw_reddit_enriched, x_items, raw_xai, x_error
+        growth_signals = phases["growth"].result()
+        growth_map = {g.subreddit: g.acceleration for g in growth_signals}
 
-        if reddit_future:
+        selected_models = phases["models"].result()
+
+        if run_reddit:
             try:
-                reddit_items, raw_openai, reddit_error = reddit_future.result()
-                if reddit_error:
-                    progress.show_error(f"Reddit: {reddit_error}")
+                reddit_items, raw_openai, reddit_error = phases["enrich"].result()
+                raw_reddit_enriched = list(reddit_items)
             except Exception as e:
                 reddit_error = f"{type(e).__name__}: {e}"
                 progress.show_error(f"Reddit: {e}")
-            progress.end_reddit(len(reddit_items))
+                progress.end_reddit(0)
 
-        if x_future:
+        if run_x:
             try:
-                x_items, raw_xai, x_error = x_future.result()
+                x_items, raw_xai, x_error = phases["x"].result()
                 if x_error:
                     progress.show_error(f"X: {x_error}")
             except Exception as e:
@@ -316,63 +778,144 @@ def main():
                 progress.show_error(f"X: {e}")
             progress.end_x(len(x_items))
 
-    # -- Phase 4: Reddit Enrichment --
-
-    if reddit_items:
-        progress.start_reddit_enrich(1, len(reddit_items))
+        # -- Phase 5: Processing --
 
-        for i, item in enumerate(reddit_items):
-            if i > 0:
-                progress.update_reddit_enrich(i + 1, len(reddit_items))
+        progress.start_processing()
 
-            try:
-                if args.mock:
-                    mock_thread = load_fixture("reddit_thread_sample.json")
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item, mock_thread)
-                else:
-                    reddit_items[i] = reddit_enrich.enrich_reddit_item(item)
-            except Exception as e:
-                progress.show_error(f"Enrich failed for {item.get('url', 'unknown')}: {e}")
-
-            raw_reddit_enriched.append(reddit_items[i])
-
-        progress.end_reddit_enrich()
-
-    # -- Phase 5: Processing --
-
-    progress.start_processing()
-
-    # Normalize
-    normalized_reddit = normalize.normalize_reddit_saas_items(
-        reddit_items, from_date, to_date, growth_map
-    )
-    normalized_x = normalize.normalize_x_saas_items(
-        x_items, from_date, to_date
-    )
-
-    all_items = normalized_reddit + normalized_x
-
-    # Date filter
-    filtered = normalize.filter_by_date_range(all_items, from_date, to_date)
-
-    # Cluster similar ideas
-    clustered = idea_cluster.cluster_ideas(filtered)
-
-    # Score
-    scored = score.score_saas_items(clustered)
-
-    # Sort
-    sorted_items = score.sort_items(scored)
+        # Normalize
+        with timing.span("normalize"):
+            normalized_reddit = normalize.normalize_reddit_saas_items(
+                reddit_items, from_date, to_date, growth_map
+            )
+            normalized_x = normalize.normalize_x_saas_items(
+                x_items, from_date, to_date
+            )
 
-    # Dedupe
-    deduped = dedupe.dedupe_saas(sorted_items)
+            all_items = normalized_reddit + normalized_x
+
+            # Date filter
+            filtered = normalize.filter_by_date_range(all_items, from_date, to_date)
+
+        # Cluster similar ideas
+        with timing.span("cluster"):
+            clustered = idea_cluster.cluster_ideas(filtered)
+
+        # Score
+        with timing.span("score"):
+            scored = score.score_saas_items(clustered)
+
+            # Sort
+            sorted_items = score.sort_items(scored)
+
+        # Dedupe
+        with timing.span("dedupe"):
+            deduped = dedupe.dedupe_saas(sorted_items)
+        return deduped
+
+    # Comment trees only for the Reddit items the report shows (enrichment
+    # refreshed engagement in bulk; mock threads already carry comments)
+    fetch_comments = run_reddit and mock_thread is None
+
+    async def _finish_async(phases: dict) -> List[schema.SaaSIdeaItem]:
+        deduped = _finish(phases)
+        if fetch_comments:
+            with timing.span("comments"):
+                await async_pipeline.fetch_comments_async(
+                    deduped, error_callback=_on_comments_error, use_cache=not args.refresh,
+                )
+        return deduped
+
+    if shared is None:
+        progress.start_growth_scan()
+
+    if args.async_mode:
+        deduped = asyncio.run(_run_phases_async(
+            args, depth, topic, config, setup, available, missing_keys,
+            from_date, to_date, run_reddit, run_x, progress,
+            _after_reddit_search, _on_enrich_error, mock_thread, _finish_async, shared,
+        ))
+    else:
+        with scheduler.PhaseScheduler() as sched:
+            def _run_growth():
+                if shared is not None:
+                    return shared["growth"]
+                signals = subreddit_growth.scan_growth(
+                    mock=args.mock,
+                    subreddits=_growth_subreddits(args),
+                    progress_callback=progress.update_growth_scan,
+                    max_age_hours=args.growth_max_age,
+                    refresh=args.refresh_growth,
+                )
+                progress.end_growth_scan(len(signals))
+                return signals
+
+            def _run_reddit():
+                progress.start_reddit()
+                return _search_reddit(
+                    topic, config, sched.result("models"),
+                    from_date, to_date, depth, args.mock, sched.result("growth"),
+                )
+
+            def _run_enrich():
+                # Starts as soon as Reddit search returns, overlapping the X call
+                result = sched.result("reddit")
+                items = _after_reddit_search(result)
+
+                if items:
+                    progress.start_reddit_enrich(1, len(items))
+                    items = reddit_enrich.enrich_reddit_items(
+                        items,
+                        mock_thread_data=mock_thread,
+                        max_workers=args.enrich_workers,
+                        progress_callback=progress.update_reddit_enrich,
+                        error_callback=_on_enrich_error,
+                        use_cache=not args.refresh,
+                        comments=False,
+                    )
+                    progress.end_reddit_enrich()
+
+                return items, result[1], result[2]
+
+            def _run_x():
+                progress.start_x()
+                return _search_x(
+                    topic, config, sched.result("models"),
+                    from_date, to_date, depth, args.mock,
+                )
+
+            sched.add("growth", _run_growth)
+            if shared is not None:
+                sched.add("models", lambda: shared["models"])
+            else:
+                sched.add(
+                    "models",
+                    _select_models,
+                    args.mock, setup, config, available, missing_keys,
+                )
+            if run_reddit:
+                sched.add("reddit", _run_reddit, after=["models", "growth"])
+                sched.add("enrich", _run_enrich, after=["reddit"])
+            if run_x:
+                sched.add("x", _run_x, after=["models"])
+
+            phases = sched.futures
+
+        deduped = _finish(phases)
+        if fetch_comments:
+            with timing.span("comments"):
+                reddit_enrich.fetch_comments(
+                    deduped,
+                    max_workers=args.enrich_workers,
+                    error_callback=_on_comments_error,
+                    use_cache=not args.refresh,
+                )
 
     progress.end_processing()
 
     # -- Phase 6: Output --
 
     report = schema.create_saas_report(
-        args.topic,
+        topic,
         from_date,
         to_date,
         mode,
@@ -384,17 +927,22 @@ def main():
     report.reddit_error = reddit_error
     report.x_error = x_error
 
+    # Cache complete reports only; partial results should be retried
+    if not args.mock and not reddit_error and not x_error:
+        cache.save_cache(cache_key, report.to_dict())
+
     # Write output files
-    render.write_outputs(report, raw_openai, raw_xai, raw_reddit_enriched)
+    if timing.ENABLED:
+        report.timing = timing.summary()
+    with timing.span("write_outputs"):
+        render.write_outputs(report, raw_openai, raw_xai, raw_reddit_enriched, out_dir=out_dir)
+    if timing.ENABLED:
+        report.timing = timing.summary()
 
     # Show completion
     progress.show_complete(len(deduped), len(growth_signals))
 
-    # Output to stdout
-    if args.emit == "compact":
-        print(render.render_compact(report, missing_keys=missing_keys))
-    elif args.emit == "json":
-        print(json.dumps(report.to_dict(), indent=2))
+    return report
 
 
 if __name__ == "__main__":